@@ -11,10 +11,17 @@ Uses actual play-by-play data aggregated over the 2024 regular season.
 Automatically caches processed data for faster subsequent runs.
 """
 
+import multiprocessing
 import pandas as pd
+import matplotlib
+
+# Non-interactive backend so pool workers never try to initialise a GUI
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.gridspec import GridSpec
+from matplotlib.lines import Line2D
 import os
 import sys
 
@@ -24,8 +31,11 @@ import nflplotpy as nflplot
 import nfl_data_py as nfl
 
 
-def load_and_process_2024_data():
-    """Load 2024 NFL team EPA data - uses cached data if available, otherwise downloads fresh data."""
+def load_and_process_2024_data(verbose=True):
+    """Load 2024 NFL team EPA data - uses cached data if available, otherwise downloads fresh data.
+
+    Pass ``verbose=False`` to skip the range and top-5 summary printout.
+    """
     cache_file = os.path.join(os.path.dirname(__file__), "2024_nfl_team_epa_data.csv")
 
     if os.path.exists(cache_file):
@@ -37,36 +47,34 @@ def load_and_process_2024_data():
             "📥 Cached data not found. Downloading fresh 2024 NFL play-by-play data..."
         )
 
-        # Load 2024 regular season data
-        pbp = nfl.import_pbp_data([2024])
+        # Load 2024 regular season data - only the columns this script uses
+        pbp = nfl.import_pbp_data(
+            [2024], columns=["season_type", "epa", "posteam", "defteam"]
+        )
         print(f"Loaded {len(pbp):,} plays from 2024 season")
 
         # Filter for regular season only
-        pbp_reg = pbp[pbp["season_type"] == "REG"].copy()
-        print(f"Regular season plays: {len(pbp_reg):,}")
-
-        # Remove plays with missing EPA or team data
-        pbp_clean = pbp_reg[
-            (pbp_reg["epa"].notna())
-            & (pbp_reg["posteam"].notna())
-            & (pbp_reg["defteam"].notna())
-        ].copy()
+        is_reg = pbp["season_type"].eq("REG")
+        print(f"Regular season plays: {is_reg.sum():,}")
+
+        # Remove plays with missing EPA or team data - one projected subset
+        # instead of copying the full frame after each filter
+        pbp_clean = pbp.loc[is_reg, ["epa", "posteam", "defteam"]].dropna()
         print(f"Clean plays with EPA data: {len(pbp_clean):,}")
 
         # Calculate offensive EPA per play by team
         print("Calculating offensive EPA per play...")
         offensive_stats = (
-            pbp_clean.groupby("posteam")
-            .agg({"epa": ["mean", "count", "sum"], "play_id": "count"})
-            .round(4)
+            pbp_clean.groupby("posteam").agg({"epa": ["mean", "count", "sum"]}).round(4)
         )
 
         offensive_stats.columns = [
             "off_epa_per_play",
             "off_epa_count",
             "off_total_epa",
-            "off_total_plays",
         ]
+        # Every clean play has an EPA value, so the EPA count is the play count
+        offensive_stats["off_total_plays"] = offensive_stats["off_epa_count"]
         offensive_stats = offensive_stats.reset_index()
         offensive_stats.columns = [
             "team",
@@ -79,17 +87,15 @@ def load_and_process_2024_data():
         # Calculate defensive EPA per play allowed by team
         print("Calculating defensive EPA per play allowed...")
         defensive_stats = (
-            pbp_clean.groupby("defteam")
-            .agg({"epa": ["mean", "count", "sum"], "play_id": "count"})
-            .round(4)
+            pbp_clean.groupby("defteam").agg({"epa": ["mean", "count", "sum"]}).round(4)
         )
 
         defensive_stats.columns = [
             "def_epa_per_play",
             "def_epa_count",
             "def_total_epa",
-            "def_total_plays",
         ]
+        defensive_stats["def_total_plays"] = defensive_stats["def_epa_count"]
         defensive_stats = defensive_stats.reset_index()
         defensive_stats.columns = [
             "team",
@@ -113,23 +119,29 @@ def load_and_process_2024_data():
         team_stats.to_csv(cache_file, index=False)
         print(f"💾 Cached processed data to: {cache_file}")
 
-    # Display summary info
     print(f"Final dataset: {len(team_stats)} teams")
-    print(
-        f"Offensive EPA range: {team_stats['off_epa_per_play'].min():.3f} to {team_stats['off_epa_per_play'].max():.3f}"
-    )
-    print(
-        f"Defensive EPA range: {team_stats['def_epa_per_play'].min():.3f} to {team_stats['def_epa_per_play'].max():.3f}"
-    )
 
-    # Display top/bottom teams
-    print("\nTop 5 Offensive Teams (EPA/play):")
-    top_off = team_stats.nlargest(5, "off_epa_per_play")[["team", "off_epa_per_play"]]
-    print(top_off.to_string(index=False))
+    if verbose:
+        # Display summary info
+        print(
+            f"Offensive EPA range: {team_stats['off_epa_per_play'].min():.3f} to {team_stats['off_epa_per_play'].max():.3f}"
+        )
+        print(
+            f"Defensive EPA range: {team_stats['def_epa_per_play'].min():.3f} to {team_stats['def_epa_per_play'].max():.3f}"
+        )
+
+        # Display top/bottom teams
+        print("\nTop 5 Offensive Teams (EPA/play):")
+        top_off = team_stats.nlargest(5, "off_epa_per_play")[
+            ["team", "off_epa_per_play"]
+        ]
+        print(top_off.to_string(index=False))
 
-    print("\nTop 5 Defensive Teams (lowest EPA/play allowed):")
-    top_def = team_stats.nsmallest(5, "def_epa_per_play")[["team", "def_epa_per_play"]]
-    print(top_def.to_string(index=False))
+        print("\nTop 5 Defensive Teams (lowest EPA/play allowed):")
+        top_def = team_stats.nsmallest(5, "def_epa_per_play")[
+            ["team", "def_epa_per_play"]
+        ]
+        print(top_def.to_string(index=False))
 
     return team_stats[["team", "off_epa_per_play", "def_epa_per_play"]]
 
@@ -153,6 +165,40 @@ def get_division_teams():
     }
 
 
+def _padded_limits(data, pad=0.05):
+    """Axis limits covering every team's EPA with extra padding for logos."""
+    x = data["off_epa_per_play"]
+    y = data["def_epa_per_play"]
+    x_pad = (x.max() - x.min()) * pad
+    y_pad = (y.max() - y.min()) * pad
+    return (x.min() - x_pad, x.max() + x_pad), (y.min() - y_pad, y.max() + y_pad)
+
+
+def _reference_line_handles(suffix, alpha):
+    """Legend handles for the league and AFC/NFC average reference lines."""
+    return [
+        Line2D([], [], color="gray", linestyle="--", alpha=alpha, label="League Avg"),
+        Line2D(
+            [],
+            [],
+            color="red",
+            linestyle=":",
+            alpha=0.8,
+            linewidth=2,
+            label=f"AFC {suffix}",
+        ),
+        Line2D(
+            [],
+            [],
+            color="blue",
+            linestyle=":",
+            alpha=0.8,
+            linewidth=2,
+            label=f"NFC {suffix}",
+        ),
+    ]
+
+
 def create_all_teams_plot(data, show_logos=True):
     """Create plot with all 32 teams - offensive vs defensive EPA."""
     print("Creating all teams plot...")
@@ -413,6 +459,11 @@ def create_division_plots(data, show_logos=True):
 
     divisions = get_division_teams()
 
+    # League-wide averages and axis limits are shared by every subplot
+    league_avg_off = data["off_epa_per_play"].mean()
+    league_avg_def = data["def_epa_per_play"].mean()
+    xlim, ylim = _padded_limits(data)
+
     # Create figure with 2x4 subplot grid
     fig = plt.figure(figsize=(28, 16))
     gs = GridSpec(2, 4, figure=fig, hspace=0.4, wspace=0.35)
@@ -493,30 +544,17 @@ def create_division_plots(data, show_logos=True):
                 )
 
         # Add reference lines - league and division averages
-        league_avg_off = data["off_epa_per_play"].mean()
-        league_avg_def = data["def_epa_per_play"].mean()
         div_avg_off = div_data["off_epa_per_play"].mean()
         div_avg_def = div_data["def_epa_per_play"].mean()
 
         # League averages (gray dashed)
-        ax.axhline(
-            y=league_avg_def,
-            color="gray",
-            linestyle="--",
-            alpha=0.5,
-            label="League Avg",
-        )
+        ax.axhline(y=league_avg_def, color="gray", linestyle="--", alpha=0.5)
         ax.axvline(x=league_avg_off, color="gray", linestyle="--", alpha=0.5)
 
         # Division averages with conference colors
         div_color = "red" if "AFC" in division else "blue"
         ax.axhline(
-            y=div_avg_def,
-            color=div_color,
-            linestyle=":",
-            alpha=0.8,
-            linewidth=2,
-            label=f"{division} Avg",
+            y=div_avg_def, color=div_color, linestyle=":", alpha=0.8, linewidth=2
         )
         ax.axvline(
             x=div_avg_off, color=div_color, linestyle=":", alpha=0.8, linewidth=2
@@ -527,24 +565,22 @@ def create_division_plots(data, show_logos=True):
         ax.set_xlabel("Offensive EPA/Play", fontsize=10)
         ax.set_ylabel("Defensive EPA/Play", fontsize=10)
 
-        # Apply NFL theme
+        # Apply NFL theme (includes the minimal grid)
         nflplot.apply_nfl_theme(ax, style="minimal")
-        ax.grid(True, alpha=0.2)
-
-        # Add legend for reference lines
-        ax.legend(loc="upper right", fontsize=8, framealpha=0.9)
 
         # Set consistent axis limits with extra padding for logos
-        x_range = data["off_epa_per_play"].max() - data["off_epa_per_play"].min()
-        y_range = data["def_epa_per_play"].max() - data["def_epa_per_play"].min()
-        ax.set_xlim(
-            data["off_epa_per_play"].min() - x_range * 0.05,
-            data["off_epa_per_play"].max() + x_range * 0.05,
-        )
-        ax.set_ylim(
-            data["def_epa_per_play"].min() - y_range * 0.05,
-            data["def_epa_per_play"].max() + y_range * 0.05,
-        )
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+
+    # One shared legend for the reference lines instead of one per subplot
+    fig.legend(
+        handles=_reference_line_handles("Division Avg", alpha=0.5),
+        loc="lower center",
+        bbox_to_anchor=(0.5, 0.025),
+        ncol=3,
+        fontsize=11,
+        framealpha=0.9,
+    )
 
     # Overall title
     fig.suptitle(
@@ -608,6 +644,11 @@ def create_conference_comparison(data, show_logos=True):
 
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 12))
 
+    # League-wide averages and axis limits are shared by both subplots
+    league_avg_off = data["off_epa_per_play"].mean()
+    league_avg_def = data["def_epa_per_play"].mean()
+    xlim, ylim = _padded_limits(data)
+
     for i, conf in enumerate(["AFC", "NFC"]):
         ax = ax1 if i == 0 else ax2
         conf_data = data_with_conf[data_with_conf["conference"] == conf]
@@ -681,27 +722,12 @@ def create_conference_comparison(data, show_logos=True):
         avg_def = conf_data["def_epa_per_play"].mean()
 
         # Add reference lines - both league and conference averages
-        league_avg_off = data["off_epa_per_play"].mean()
-        league_avg_def = data["def_epa_per_play"].mean()
-        ax.axhline(
-            y=league_avg_def,
-            color="gray",
-            linestyle="--",
-            alpha=0.4,
-            label="League Avg",
-        )
+        ax.axhline(y=league_avg_def, color="gray", linestyle="--", alpha=0.4)
         ax.axvline(x=league_avg_off, color="gray", linestyle="--", alpha=0.4)
 
         # Add conference-specific averages with proper colors
         conf_color = "red" if conf == "AFC" else "blue"
-        ax.axhline(
-            y=avg_def,
-            color=conf_color,
-            linestyle=":",
-            alpha=0.8,
-            linewidth=2,
-            label=f"{conf} Avg",
-        )
+        ax.axhline(y=avg_def, color=conf_color, linestyle=":", alpha=0.8, linewidth=2)
         ax.axvline(x=avg_off, color=conf_color, linestyle=":", alpha=0.8, linewidth=2)
 
         # Styling
@@ -719,29 +745,26 @@ def create_conference_comparison(data, show_logos=True):
             bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8),
         )
 
-        # Apply NFL theme
+        # Apply NFL theme (includes the grid)
         nflplot.apply_nfl_theme(ax, style="default")
-        ax.grid(True, alpha=0.3)
-
-        # Add legend for reference lines
-        ax.legend(loc="upper right", fontsize=9, framealpha=0.9)
 
         # Set consistent limits with extra padding for logos
-        x_range = data["off_epa_per_play"].max() - data["off_epa_per_play"].min()
-        y_range = data["def_epa_per_play"].max() - data["def_epa_per_play"].min()
-        ax.set_xlim(
-            data["off_epa_per_play"].min() - x_range * 0.05,
-            data["off_epa_per_play"].max() + x_range * 0.05,
-        )
-        ax.set_ylim(
-            data["def_epa_per_play"].min() - y_range * 0.05,
-            data["def_epa_per_play"].max() + y_range * 0.05,
-        )
+        ax.set_xlim(xlim)
+        ax.set_ylim(ylim)
+
+    # One shared legend for the reference lines instead of one per subplot
+    fig.legend(
+        handles=_reference_line_handles("Avg", alpha=0.4),
+        loc="lower center",
+        ncol=3,
+        fontsize=10,
+        framealpha=0.9,
+    )
 
     plt.suptitle(
         "2024 NFL AFC vs NFC Performance Comparison", fontsize=16, fontweight="bold"
     )
-    plt.tight_layout()
+    plt.tight_layout(rect=[0, 0.04, 1, 1])  # Leave room for the shared legend
 
     # Save in nflplotpy examples directory
     output_dir = os.path.dirname(__file__)
@@ -752,6 +775,20 @@ def create_conference_comparison(data, show_logos=True):
     return fig
 
 
+def _render_one(kind, data, show_logos=True):
+    """Render and save a single figure, closing it afterwards.
+
+    Runs in a worker process, so nothing is returned besides the saved PNG.
+    """
+    renderers = {
+        "all_teams": create_all_teams_plot,
+        "divisions": create_division_plots,
+        "conferences": create_conference_comparison,
+    }
+    fig = renderers[kind](data, show_logos=show_logos)
+    plt.close(fig)
+
+
 def main():
     """Create all example plots using 2024 NFL data."""
     print("nflplotpy Examples - 2024 NFL Season")
@@ -766,14 +803,16 @@ def main():
         print("🏈 Creating all plots with team logos enabled!")
         show_logos = True  # The key setting - enables logos instead of dots
 
-        fig1 = create_all_teams_plot(data, show_logos=show_logos)
-        plt.close(fig1)
-
-        fig2 = create_division_plots(data, show_logos=show_logos)
-        plt.close(fig2)
-
-        fig3 = create_conference_comparison(data, show_logos=show_logos)
-        plt.close(fig3)
+        # The three figures are independent, so render them on separate cores
+        with multiprocessing.Pool(3) as pool:
+            pool.starmap(
+                _render_one,
+                [
+                    ("all_teams", data, show_logos),
+                    ("divisions", data, show_logos),
+                    ("conferences", data, show_logos),
+                ],
+            )
 
         print("\n" + "=" * 50)
         print("✅ All plots created successfully using 2024 NFL data.")
@@ -117,12 +117,10 @@ def example_player_stats_table():
 
     # Save to HTML
     output_path = os.path.join(os.path.dirname(__file__), "player_stats_table.html")
-    styled.to_html().replace("table", "table").replace(
-        "<th>", '<th style="padding: 10px;">'
-    )
+    html = styled.to_html().replace("<th>", '<th style="padding: 10px;">')
 
-    with open(output_path, "w") as f:
-        f.write(styled.to_html())
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(html)
 
     print(f"✅ Saved player stats table to: {output_path}")
     print("   Features: player names, team logos, colored stats!")
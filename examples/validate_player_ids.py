@@ -9,32 +9,99 @@ Requirements:
 - nflplotpy with nfl_data_py integration
 """
 
+import argparse
+import importlib.util
+import re
 import warnings
 
 warnings.filterwarnings("ignore")
 
-import pandas as pd
-import requests
-from io import BytesIO
-from PIL import Image
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    import nfl_data_py as nfl
+import pandas as pd
 
-    NFL_DATA_AVAILABLE = True
-except ImportError:
-    NFL_DATA_AVAILABLE = False
+# nfl_data_py is only imported when play-by-play data has to be downloaded
+NFL_DATA_AVAILABLE = importlib.util.find_spec("nfl_data_py") is not None
+if not NFL_DATA_AVAILABLE:
     print("nfl_data_py not available. Please install for full validation.")
 
+from nflplotpy.core.assets import get_http_session
+from nflplotpy.core.logos import get_asset_manager
 from nflplotpy.core.urls import (
-    get_player_info_by_id,
+    PlayerHeadshotURLBuilder,
+    get_players_info_by_ids,
     get_player_headshot_urls,
     discover_player_id,
 )
 
+# Play-by-play columns needed to find and identify passers
+PBP_COLUMNS = ["passer_player_id", "passer_player_name", "season_type"]
+
+# Shape of a full-size ESPN headshot URL, used to judge headshots offline
+ESPN_HEADSHOT_PATTERN = re.compile(
+    re.escape(PlayerHeadshotURLBuilder.ESPN_HEADSHOT_BASE).replace(
+        re.escape("{player_id}"), r"\d{3,7}"
+    )
+)
+
+# Headshot checks made during this run, keyed by URL
+_HEADSHOT_CHECKS = {}
+
 
-def validate_known_players():
+def _cached(name, season, loader):
+    """Return loader()'s frame, reusing a local Parquet copy after the first run.
+
+    Args:
+        name: Dataset name used in the cache file name
+        season: Season the data covers
+        loader: Zero-argument callable that downloads the data
+    """
+    path = get_asset_manager().cache_dir / f"{name}_{season}.parquet"
+    if path.exists():
+        return pd.read_parquet(path)
+
+    df = loader()
+    try:
+        df.to_parquet(path, compression="zstd")
+    except (ImportError, OSError) as e:
+        print(f"Could not cache {name} data: {e}")
+    return df
+
+
+def _check_headshots(urls, offline=False):
+    """HEAD every distinct headshot URL concurrently over the shared HTTP session.
+
+    URLs already checked during this run are not probed again. With
+    ``offline=True`` nothing is requested and a URL counts as accessible when
+    it matches the ESPN headshot template.
+
+    Returns:
+        (accessible, error) for each URL, in input order; empty URLs are
+        skipped and reported as (False, None)
+    """
+    if offline:
+        return [
+            (bool(url) and ESPN_HEADSHOT_PATTERN.fullmatch(url) is not None, None)
+            for url in urls
+        ]
+
+    session = get_http_session()
+
+    def check(url):
+        try:
+            return session.head(url, timeout=5).status_code == 200, None
+        except Exception as e:
+            return False, e
+
+    pending = [
+        url for url in dict.fromkeys(urls) if url and url not in _HEADSHOT_CHECKS
+    ]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        _HEADSHOT_CHECKS.update(zip(pending, executor.map(check, pending)))
+    return [_HEADSHOT_CHECKS.get(url, (False, None)) for url in urls]
+
+
+def validate_known_players(offline=False):
     """Test player ID lookups for well-known players."""
 
     print("🔍 VALIDATING KNOWN PLAYERS")
@@ -49,41 +116,58 @@ def validate_known_players():
         ("Lamar Jackson", "00-0031280", "3916387"),
     ]
 
+    # Check every headshot URL up front, concurrently
+    headshot_urls = [
+        get_player_headshot_urls(expected_espn, id_type="espn").get("espn_full", "")
+        for _, _, expected_espn in known_players
+    ]
+    headshot_checks = _check_headshots(headshot_urls, offline)
+
+    # Resolve every expected ID in two batch lookups against the ID table
+    gsis_results = get_players_info_by_ids(
+        [expected_gsis for _, expected_gsis, _ in known_players], id_type="gsis"
+    )
+    espn_results = get_players_info_by_ids(
+        [expected_espn for _, _, expected_espn in known_players], id_type="espn"
+    )
+
     validation_results = []
 
-    for name, expected_gsis, expected_espn in known_players:
-        print(f"\n🏈 Testing: {name}")
+    for (name, expected_gsis, expected_espn), headshot_url, (
+        headshot_accessible,
+        headshot_error,
+    ) in zip(known_players, headshot_urls, headshot_checks):
+        # Collect this player's report and write it in one call
+        lines = [f"\n🏈 Testing: {name}"]
 
         # Test name-based lookup
         name_result = discover_player_id(name)
-        print(
+        lines.append(
             f"   Name lookup - GSIS: {name_result.get('gsis_id')}, ESPN: {name_result.get('espn_id')}"
         )
 
         # Test GSIS ID lookup
-        gsis_result = get_player_info_by_id(expected_gsis, id_type="gsis")
-        print(
+        gsis_result = gsis_results[expected_gsis]
+        lines.append(
             f"   GSIS lookup - Name: {gsis_result.get('name')}, ESPN: {gsis_result.get('espn_id')}"
         )
 
         # Test ESPN ID lookup
-        espn_result = get_player_info_by_id(expected_espn, id_type="espn")
-        print(
+        espn_result = espn_results[expected_espn]
+        lines.append(
             f"   ESPN lookup - Name: {espn_result.get('name')}, GSIS: {espn_result.get('gsis_id')}"
         )
 
-        # Validate headshot URL accessibility
-        headshot_urls = get_player_headshot_urls(expected_espn, id_type="espn")
-        headshot_accessible = False
-        if headshot_urls.get("espn_full"):
-            try:
-                response = requests.head(headshot_urls["espn_full"], timeout=5)
-                headshot_accessible = response.status_code == 200
-                print(
+        # Report headshot URL accessibility
+        if headshot_url:
+            if headshot_error is None:
+                lines.append(
                     f"   Headshot URL: {'✅ Accessible' if headshot_accessible else '❌ Not accessible'}"
                 )
-            except Exception:
-                print(f"   Headshot URL: ❌ Error checking accessibility")
+            else:
+                lines.append(f"   Headshot URL: ❌ Error checking accessibility")
+
+        print("\n".join(lines))
 
         # Record validation result
         validation_results.append(
@@ -102,7 +186,14 @@ def validate_known_players():
     return pd.DataFrame(validation_results)
 
 
-def validate_2024_qb_ids():
+def _import_passers():
+    """Download the passer columns of 2024 play-by-play with nfl_data_py."""
+    import nfl_data_py as nfl
+
+    return nfl.import_pbp_data([2024], columns=PBP_COLUMNS)[PBP_COLUMNS]
+
+
+def validate_2024_qb_ids(offline=False):
     """Validate player IDs from actual 2024 play-by-play data."""
 
     print("\n🏈 VALIDATING 2024 QB DATA")
@@ -115,81 +206,93 @@ def validate_2024_qb_ids():
     try:
         # Load 2024 play-by-play data
         print("Loading 2024 play-by-play data...")
-        pbp_data = nfl.import_pbp_data([2024])
+        pbp_data = _cached("pbp_passers", 2024, _import_passers)
 
         # Get top QBs by attempts
         qb_data = pbp_data[
             (pbp_data["passer_player_name"].notna())
             & (pbp_data["passer_player_id"].notna())
             & (pbp_data["season_type"] == "REG")
-        ].copy()
+        ]
 
-        # Top QBs by pass attempts
+        # Top QBs by pass attempts, counted and sorted in one step
         top_qbs = (
-            qb_data.groupby(["passer_player_id", "passer_player_name"])
-            .size()
-            .nlargest(10)
+            qb_data.value_counts(["passer_player_id", "passer_player_name"])
+            .head(10)
+            .rename("attempts")
+            .reset_index()
         )
 
-        validation_results = []
-
         print(f"\nValidating top 10 QBs by attempts...")
 
-        for (player_id, player_name), attempts in top_qbs.items():
-            print(f"\n📊 {player_name} (GSIS: {player_id}, Attempts: {attempts})")
-
-            # Lookup player info using GSIS ID
-            player_info = get_player_info_by_id(player_id, id_type="gsis")
+        # Resolve every GSIS ID in one batch and attach the results as columns
+        infos = get_players_info_by_ids(
+            top_qbs["passer_player_id"].tolist(), id_type="gsis"
+        )
+        espn_ids = top_qbs["passer_player_id"].map(
+            {pid: info["espn_id"] for pid, info in infos.items()}
+        )
+        results = pd.DataFrame(
+            {
+                "pbp_name": top_qbs["passer_player_name"],
+                "gsis_id": top_qbs["passer_player_id"],
+                "espn_id": espn_ids,
+                "validated_name": top_qbs["passer_player_id"]
+                .map({pid: info["name"] for pid, info in infos.items()})
+                .where(espn_ids.notna()),
+                "attempts": top_qbs["attempts"],
+            }
+        )
+        results["name_match"] = [
+            bool(validated) and pbp.lower() in validated.lower()
+            for pbp, validated in zip(
+                results["pbp_name"], results["validated_name"].fillna("")
+            )
+        ]
+        results["headshot_url"] = [
+            get_player_headshot_urls(espn_id, id_type="espn").get("espn_full", "")
+            if pd.notna(espn_id)
+            else ""
+            for espn_id in results["espn_id"]
+        ]
 
-            if player_info["espn_id"]:
-                print(f"   ✅ Found ESPN ID: {player_info['espn_id']}")
-                print(f"   ✅ Validated name: {player_info['name']}")
+        # Check the headshots concurrently, then report player by player
+        headshot_checks = _check_headshots(results["headshot_url"], offline)
+        for row, (accessible, error) in zip(
+            results.itertuples(index=False), headshot_checks
+        ):
+            print(
+                f"\n📊 {row.pbp_name} (GSIS: {row.gsis_id}, Attempts: {row.attempts})"
+            )
 
-                # Test headshot URL
-                headshot_urls = get_player_headshot_urls(
-                    player_info["espn_id"], id_type="espn"
-                )
-                headshot_accessible = False
-
-                if headshot_urls.get("espn_full"):
-                    try:
-                        response = requests.head(headshot_urls["espn_full"], timeout=5)
-                        headshot_accessible = response.status_code == 200
-                        print(
-                            f"   {'✅' if headshot_accessible else '❌'} Headshot: {headshot_urls['espn_full']}"
-                        )
-                    except Exception as e:
-                        print(f"   ❌ Headshot error: {e}")
-
-                validation_results.append(
-                    {
-                        "pbp_name": player_name,
-                        "gsis_id": player_id,
-                        "espn_id": player_info["espn_id"],
-                        "validated_name": player_info["name"],
-                        "attempts": attempts,
-                        "name_match": player_info["name"]
-                        and player_name.lower() in player_info["name"].lower(),
-                        "headshot_accessible": headshot_accessible,
-                        "headshot_url": headshot_urls.get("espn_full", ""),
-                    }
-                )
-            else:
+            if pd.isna(row.espn_id):
                 print(f"   ❌ No ESPN ID found")
-                validation_results.append(
-                    {
-                        "pbp_name": player_name,
-                        "gsis_id": player_id,
-                        "espn_id": None,
-                        "validated_name": None,
-                        "attempts": attempts,
-                        "name_match": False,
-                        "headshot_accessible": False,
-                        "headshot_url": "",
-                    }
-                )
-
-        return pd.DataFrame(validation_results)
+            else:
+                print(f"   ✅ Found ESPN ID: {row.espn_id}")
+                print(f"   ✅ Validated name: {row.validated_name}")
+
+                if error is not None:
+                    print(f"   ❌ Headshot error: {error}")
+                elif row.headshot_url:
+                    print(
+                        f"   {'✅' if accessible else '❌'} Headshot: {row.headshot_url}"
+                    )
+
+        results["headshot_accessible"] = [
+            accessible for accessible, _ in headshot_checks
+        ]
+        return results[
+            [
+                "pbp_name",
+                "gsis_id",
+                "espn_id",
+                "validated_name",
+                "attempts",
+                "name_match",
+                "headshot_accessible",
+                "headshot_url",
+            ]
+        ]
 
     except Exception as e:
         print(f"❌ Error validating 2024 QB data: {e}")
@@ -199,24 +302,24 @@ def validate_2024_qb_ids():
 def create_validation_report(known_results, qb_results):
     """Create a comprehensive validation report."""
 
-    print("\n📊 VALIDATION REPORT")
-    print("=" * 50)
+    # Build the whole report and write it in one call
+    lines = ["\n📊 VALIDATION REPORT", "=" * 50]
 
     if not known_results.empty:
-        print("\n🔍 Known Players Validation:")
-        print(
+        lines.append("\n🔍 Known Players Validation:")
+        lines.append(
             f"   ✅ Name→GSIS matches: {known_results['name_gsis_match'].sum()}/{len(known_results)}"
         )
-        print(
+        lines.append(
             f"   ✅ Name→ESPN matches: {known_results['name_espn_match'].sum()}/{len(known_results)}"
         )
-        print(
+        lines.append(
             f"   ✅ GSIS lookup success: {known_results['gsis_lookup_success'].sum()}/{len(known_results)}"
         )
-        print(
+        lines.append(
             f"   ✅ ESPN lookup success: {known_results['espn_lookup_success'].sum()}/{len(known_results)}"
         )
-        print(
+        lines.append(
             f"   ✅ Headshots accessible: {known_results['headshot_accessible'].sum()}/{len(known_results)}"
         )
 
@@ -225,41 +328,50 @@ def create_validation_report(known_results, qb_results):
             ~(known_results["name_gsis_match"] & known_results["name_espn_match"])
         ]
         if not failures.empty:
-            print("\n❌ Failed validations:")
+            lines.append("\n❌ Failed validations:")
             for _, row in failures.iterrows():
-                print(
+                lines.append(
                     f"   - {row['name']}: GSIS={row['name_gsis_match']}, ESPN={row['name_espn_match']}"
                 )
 
     if not qb_results.empty:
-        print(f"\n🏈 2024 QB Data Validation:")
-        print(
+        lines.append(f"\n🏈 2024 QB Data Validation:")
+        lines.append(
             f"   ✅ Players with ESPN IDs: {qb_results['espn_id'].notna().sum()}/{len(qb_results)}"
         )
-        print(f"   ✅ Name matches: {qb_results['name_match'].sum()}/{len(qb_results)}")
-        print(
+        lines.append(
+            f"   ✅ Name matches: {qb_results['name_match'].sum()}/{len(qb_results)}"
+        )
+        lines.append(
             f"   ✅ Accessible headshots: {qb_results['headshot_accessible'].sum()}/{len(qb_results)}"
         )
 
         # Show players without ESPN IDs
         missing_espn = qb_results[qb_results["espn_id"].isna()]
         if not missing_espn.empty:
-            print("\n⚠️  Players missing ESPN IDs:")
+            lines.append("\n⚠️  Players missing ESPN IDs:")
             for _, row in missing_espn.iterrows():
-                print(f"   - {row['pbp_name']} (GSIS: {row['gsis_id']})")
+                lines.append(f"   - {row['pbp_name']} (GSIS: {row['gsis_id']})")
 
         # Show inaccessible headshots
         bad_headshots = qb_results[
             ~qb_results["headshot_accessible"] & qb_results["espn_id"].notna()
         ]
         if not bad_headshots.empty:
-            print("\n⚠️  Players with inaccessible headshots:")
+            lines.append("\n⚠️  Players with inaccessible headshots:")
             for _, row in bad_headshots.iterrows():
-                print(f"   - {row['validated_name']} (ESPN: {row['espn_id']})")
+                lines.append(f"   - {row['validated_name']} (ESPN: {row['espn_id']})")
+
+    print("\n".join(lines))
 
 
 def test_headshot_visual_validation():
     """Create a visual grid of headshots for manual validation."""
+    # Imaging and plotting are only needed for this visual check
+    from io import BytesIO
+
+    from matplotlib.figure import Figure
+    from PIL import Image
 
     print("\n🖼️  CREATING VISUAL VALIDATION GRID")
     print("=" * 40)
@@ -272,21 +384,39 @@ def test_headshot_visual_validation():
         ("Aaron Rodgers", "8439"),
     ]
 
-    fig, axes = plt.subplots(2, 2, figsize=(10, 10))
-    axes = axes.flatten()
+    # Each grid cell is about 5 inches across at the saved resolution
+    grid_dpi = 150
+    cell_pixels = 5 * grid_dpi
+    session = get_http_session()
+
+    def fetch_headshot(espn_id):
+        """Download a headshot and shrink it to the cell size, or return None."""
+        urls = get_player_headshot_urls(espn_id, id_type="espn")
+        if not urls.get("espn_full"):
+            return None
+        response = session.get(urls["espn_full"], timeout=10)
+        response.raise_for_status()
+
+        # Downsample once here rather than on every matplotlib draw
+        img = Image.open(BytesIO(response.content))
+        img.thumbnail((cell_pixels, cell_pixels), Image.Resampling.LANCZOS)
+        return img
+
+    # Download all headshots concurrently before drawing
+    with ThreadPoolExecutor(max_workers=len(test_players)) as executor:
+        futures = [
+            executor.submit(fetch_headshot, espn_id) for _, espn_id in test_players
+        ]
 
-    for i, (name, espn_id) in enumerate(test_players):
-        ax = axes[i]
+    # A standalone figure is never registered with pyplot, so nothing is left
+    # open if the example is called repeatedly or raises part way through
+    fig = Figure(figsize=(10, 10))
+    axes = fig.subplots(2, 2).flatten()
 
+    for ax, (name, espn_id), future in zip(axes, test_players, futures):
         try:
-            # Get headshot URL
-            urls = get_player_headshot_urls(espn_id, id_type="espn")
-            if urls.get("espn_full"):
-                # Download and display image
-                response = requests.get(urls["espn_full"], timeout=10)
-                response.raise_for_status()
-
-                img = Image.open(BytesIO(response.content))
+            img = future.result()
+            if img is not None:
                 ax.imshow(img)
                 ax.set_title(f"{name}\nESPN ID: {espn_id}", fontsize=12)
                 ax.axis("off")
@@ -314,14 +444,20 @@ def test_headshot_visual_validation():
             ax.set_title(f"{name} - ERROR", fontsize=12)
             ax.axis("off")
 
-    plt.tight_layout()
-    plt.savefig("examples/headshot_validation_grid.png", dpi=150, bbox_inches="tight")
+    fig.tight_layout()
+    fig.savefig(
+        "examples/headshot_validation_grid.png", dpi=grid_dpi, bbox_inches="tight"
+    )
     print("✅ Saved visual validation grid to: examples/headshot_validation_grid.png")
-    plt.close()
 
 
-def main():
-    """Main validation execution."""
+def main(offline=False):
+    """Main validation execution.
+
+    Args:
+        offline: Judge headshot URLs by their shape instead of requesting them,
+            and skip the visual grid, which needs the images themselves
+    """
 
     print("🔧 PLAYER ID & HEADSHOT VALIDATION")
     print("=" * 50)
@@ -329,14 +465,17 @@ def main():
     print("to ensure we're matching the correct players to their photos.\n")
 
     # Run validations
-    known_results = validate_known_players()
-    qb_results = validate_2024_qb_ids()
+    known_results = validate_known_players(offline)
+    qb_results = validate_2024_qb_ids(offline)
 
     # Create comprehensive report
     create_validation_report(known_results, qb_results)
 
     # Create visual validation
-    test_headshot_visual_validation()
+    if offline:
+        print("\n🖼️  Skipping visual validation grid in offline mode")
+    else:
+        test_headshot_visual_validation()
 
     print("\n🎉 VALIDATION COMPLETE")
     print("Review the results above and check the visual validation grid.")
@@ -344,4 +483,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="check headshot URLs by their shape instead of requesting them",
+    )
+    main(offline=parser.parse_args().offline)
@@ -9,7 +9,12 @@ __version__ = "0.9.0"
 __author__ = "nflverse"
 
 # Core functionality
-from .core.colors import NFL_TEAM_COLORS, NFLColorPalette, get_team_colors
+from .core.colors import (
+    NFL_TEAM_COLORS,
+    NFLColorPalette,
+    create_nfl_colormap,
+    get_team_colors,
+)
 from .core.logos import NFLAssetManager, get_available_teams
 
 # High-level plotting functions
@@ -87,6 +92,20 @@ from .pandas.styling import (
     style_with_wordmarks,
 )
 
+# Optional backends that pull in heavy third-party imports
+_LAZY_SUBMODULES = ("plotly", "seaborn")
+
+
+def __getattr__(name):
+    """Import the optional plotly/seaborn integrations on first access."""
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 __all__ = [
     "NFL_TEAM_COLORS",
     "AssetURLManager",
@@ -114,6 +133,7 @@ __all__ = [
     "clear_all_cache",
     "create_logo_legend",
     "create_nfl_color_palette",
+    "create_nfl_colormap",
     "create_nfl_table",
     "create_team_comparison_axes",
     "discover_player_id",
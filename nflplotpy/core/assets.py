@@ -2,13 +2,90 @@
 
 from __future__ import annotations
 
-import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import appdirs
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared HTTP session so repeated asset downloads reuse pooled keep-alive
+# connections instead of paying a fresh TLS handshake per request
+_http_session: requests.Session | None = None
+
+# Chunk size used when streaming downloads to the cache
+_DOWNLOAD_CHUNK = 64 * 1024
+
+
+def get_http_session() -> requests.Session:
+    """Get singleton HTTP session with connection pooling and retries."""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        # Set proper headers to comply with Wikipedia User-Agent policy
+        session.headers.update(
+            {
+                "User-Agent": (
+                    "nflplotpy/0.1.0 (https://github.com/nflverse/nfl_data_py; "
+                    "nflplotpy@nflverse.com) Python/3.x"
+                ),
+                "Accept": "image/*,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+            }
+        )
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def _scan_dir(dir_path: Path) -> tuple[int, int]:
+    """Count the files in a cache directory and total their size.
+
+    Uses a single ``os.scandir`` pass so each entry is visited once and its
+    cached stat information is reused.
+
+    Args:
+        dir_path: Directory to scan
+
+    Returns:
+        Tuple of (file count, total size in bytes)
+    """
+    count = size = 0
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    count += 1
+                    size += entry.stat(follow_symlinks=False).st_size
+    except FileNotFoundError:
+        pass
+    return count, size
+
+
+def _clear_dir(dir_path: Path) -> None:
+    """Delete every file directly inside a cache directory."""
+    try:
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
 
 
 class NFLAssetManager:
@@ -33,8 +110,15 @@ class NFLAssetManager:
         self.logos_dir = self.cache_dir / "logos"
         self.headshots_dir = self.cache_dir / "headshots"
         self.wordmarks_dir = self.cache_dir / "wordmarks"
-
-        for dir_path in [self.logos_dir, self.headshots_dir, self.wordmarks_dir]:
+        # Size variants live apart from the originals so logos_count stays per team
+        self.resized_logos_dir = self.logos_dir / "resized"
+
+        for dir_path in [
+            self.logos_dir,
+            self.resized_logos_dir,
+            self.headshots_dir,
+            self.wordmarks_dir,
+        ]:
             dir_path.mkdir(parents=True, exist_ok=True)
 
     def _download_image(
@@ -54,28 +138,29 @@ class NFLAssetManager:
             requests.RequestException: If download fails
             PIL.UnidentifiedImageError: If image cannot be opened
         """
+        partial_path: Path | None = None
         try:
-            # Set proper headers to comply with Wikipedia User-Agent policy
-            headers = {
-                "User-Agent": (
-                    "nflplotpy/0.1.0 (https://github.com/nflverse/nfl_data_py; "
-                    "nflplotpy@nflverse.com) Python/3.x"
-                ),
-                "Accept": "image/*,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-
-            # Save to cache
-            cache_path.write_bytes(response.content)
-
-            # Return PIL Image
-            return Image.open(io.BytesIO(response.content))
+            with get_http_session().get(url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+
+                # Stream to disk in chunks instead of holding the whole body.
+                # Each download gets its own temp file so concurrent writers of
+                # the same asset never truncate or delete each other's data.
+                with tempfile.NamedTemporaryFile(
+                    dir=cache_path.parent,
+                    prefix=f"{cache_path.name}.",
+                    suffix=".part",
+                    delete=False,
+                ) as fh:
+                    partial_path = Path(fh.name)
+                    fh.writelines(response.iter_content(_DOWNLOAD_CHUNK))
+
+            # Only a complete download replaces the cached file
+            partial_path.replace(cache_path)
+            partial_path = None
+
+            # Return PIL Image, read lazily from the cache
+            return self._load_cached_image(cache_path)
 
         except requests.RequestException as e:
             msg = f"Failed to download image from {url}: {e}"
@@ -83,6 +168,9 @@ class NFLAssetManager:
         except Exception as e:
             msg = f"Failed to process image from {url}: {e}"
             raise RuntimeError(msg) from e
+        finally:
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
 
     def _load_cached_image(self, cache_path: Path) -> Image.Image:
         """Load image from cache.
@@ -130,6 +218,91 @@ class NFLAssetManager:
         logo_url = NFL_TEAM_LOGOS[team]
         return self._download_image(logo_url, cache_path)
 
+    def get_logos(
+        self,
+        teams: list[str],
+        image_format: str = "png",
+        force_refresh: bool = False,
+        max_workers: int = 16,
+    ) -> dict[str, Image.Image]:
+        """Get several NFL team logos, downloading uncached ones concurrently.
+
+        Args:
+            teams: Team abbreviations (e.g., ['ARI', 'ATL'])
+            image_format: Image format ('png', 'svg')
+            force_refresh: If True, re-download even if cached
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Dictionary mapping each uppercase team abbreviation to its logo
+
+        Raises:
+            ValueError: If a team abbreviation is not valid
+            Exception: If a logo cannot be retrieved
+        """
+        teams = list(dict.fromkeys(team.upper() for team in teams))
+        if not teams:
+            return {}
+
+        def fetch(team: str) -> Image.Image:
+            return self.get_logo(team, image_format, force_refresh)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(teams))) as executor:
+            return dict(zip(teams, executor.map(fetch, teams)))
+
+    def get_resized_logo(
+        self, team: str, target_width_pixels: int, force_refresh: bool = False
+    ) -> Image.Image:
+        """Get NFL team logo resized to a target width.
+
+        The resized logo is cached on disk under ``logos/resized``, so the
+        resampling cost is paid once per team and size.
+
+        Args:
+            team: Team abbreviation (e.g., 'ARI', 'ATL')
+            target_width_pixels: Width in pixels (aspect ratio is preserved)
+            force_refresh: If True, re-download and re-resize even if cached
+
+        Returns:
+            PIL Image object in RGBA mode
+
+        Raises:
+            ValueError: If team abbreviation is not valid
+        """
+        team = team.upper()
+        cache_path = self.resized_logos_dir / f"{team}_logo_{target_width_pixels}px.png"
+
+        if cache_path.exists() and not force_refresh:
+            return self._load_cached_image(cache_path)
+
+        logo = self.get_logo(team, force_refresh=force_refresh).convert("RGBA")
+        orig_width, orig_height = logo.size
+        new_height = max(1, int(target_width_pixels * orig_height / orig_width))
+        resized = logo.resize(
+            (target_width_pixels, new_height),
+            Image.Resampling.LANCZOS,
+            reducing_gap=3.0,
+        )
+
+        # Write to a private temp file first so an interrupted save or a
+        # concurrent reader never sees a truncated cache entry
+        partial_path: Path | None = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent,
+                prefix=f"{cache_path.name}.",
+                suffix=".part",
+                delete=False,
+            ) as fh:
+                partial_path = Path(fh.name)
+                resized.save(fh, format="PNG")
+            partial_path.replace(cache_path)
+            partial_path = None
+        finally:
+            if partial_path is not None:
+                partial_path.unlink(missing_ok=True)
+        return resized
+
     def get_headshot(self, player_id: str, force_refresh: bool = False) -> Image.Image:
         """Get NFL player headshot.
 
@@ -185,6 +358,49 @@ class NFLAssetManager:
         placeholder.save(cache_path)
         return placeholder
 
+    def prefetch(
+        self,
+        teams: list[str],
+        kinds: tuple[str, ...] = ("logo",),
+        max_workers: int = 16,
+    ) -> dict[tuple[str, str], Image.Image | None]:
+        """Fetch team assets concurrently so later plotting hits the cache.
+
+        Args:
+            teams: Team abbreviations to fetch assets for
+            kinds: Asset kinds to fetch ('logo', 'wordmark')
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Dictionary mapping (team, kind) to the PIL Image, or None if the
+            asset could not be retrieved
+
+        Raises:
+            ValueError: If an asset kind is not valid
+        """
+        getters = {"logo": self.get_logo, "wordmark": self.get_wordmark}
+        for kind in kinds:
+            if kind not in getters:
+                msg = f"Invalid asset kind: {kind}"
+                raise ValueError(msg)
+
+        # Deduplicate while preserving order so each asset is fetched once
+        jobs = list(
+            dict.fromkeys((team.upper(), kind) for team in teams for kind in kinds)
+        )
+        if not jobs:
+            return {}
+
+        def fetch(job: tuple[str, str]) -> Image.Image | None:
+            team, kind = job
+            try:
+                return getters[kind](team)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return dict(zip(jobs, executor.map(fetch, jobs)))
+
     def clear_cache(self, asset_type: str | None = None) -> None:
         """Clear cached assets.
 
@@ -192,49 +408,40 @@ class NFLAssetManager:
             asset_type: Type of assets to clear ('logos', 'headshots', 'wordmarks').
                        If None, clears all assets.
         """
+        asset_dirs = {
+            "logos": [self.logos_dir, self.resized_logos_dir],
+            "headshots": [self.headshots_dir],
+            "wordmarks": [self.wordmarks_dir],
+        }
         if asset_type is None:
             # Clear all
-            for dir_path in [self.logos_dir, self.headshots_dir, self.wordmarks_dir]:
-                for file_path in dir_path.glob("*"):
-                    if file_path.is_file():
-                        file_path.unlink()
-        elif asset_type == "logos":
-            for file_path in self.logos_dir.glob("*"):
-                if file_path.is_file():
-                    file_path.unlink()
-        elif asset_type == "headshots":
-            for file_path in self.headshots_dir.glob("*"):
-                if file_path.is_file():
-                    file_path.unlink()
-        elif asset_type == "wordmarks":
-            for file_path in self.wordmarks_dir.glob("*"):
-                if file_path.is_file():
-                    file_path.unlink()
+            dirs = [d for type_dirs in asset_dirs.values() for d in type_dirs]
+        elif asset_type in asset_dirs:
+            dirs = asset_dirs[asset_type]
         else:
             msg = f"Invalid asset_type: {asset_type}"
             raise ValueError(msg)
 
+        for dir_path in dirs:
+            _clear_dir(dir_path)
+
     def get_cache_info(self) -> dict[str, Any]:
         """Get information about cached assets.
 
         Returns:
             Dictionary with cache statistics
         """
-
-        def count_files(directory: Path) -> int:
-            return len([f for f in directory.glob("*") if f.is_file()])
-
-        def get_directory_size(directory: Path) -> int:
-            return sum(f.stat().st_size for f in directory.glob("*") if f.is_file())
+        logos_count, logos_size = _scan_dir(self.logos_dir)
+        headshots_count, headshots_size = _scan_dir(self.headshots_dir)
+        wordmarks_count, wordmarks_size = _scan_dir(self.wordmarks_dir)
+        _, resized_size = _scan_dir(self.resized_logos_dir)
 
         return {
             "cache_dir": str(self.cache_dir),
-            "logos_count": count_files(self.logos_dir),
-            "headshots_count": count_files(self.headshots_dir),
-            "wordmarks_count": count_files(self.wordmarks_dir),
+            "logos_count": logos_count,
+            "headshots_count": headshots_count,
+            "wordmarks_count": wordmarks_count,
             "total_size_bytes": (
-                get_directory_size(self.logos_dir)
-                + get_directory_size(self.headshots_dir)
-                + get_directory_size(self.wordmarks_dir)
+                logos_size + resized_size + headshots_size + wordmarks_size
             ),
         }
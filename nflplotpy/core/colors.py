@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import matplotlib.colors as mcolors
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 # NFL team colors based on nflverse data
 # Source: https://raw.githubusercontent.com/leesharpe/nfldata/master/data/teamcolors.csv
@@ -297,6 +304,22 @@ NFL_TEAM_COLORS: dict[str, dict[str, str]] = {
     },
 }
 
+# Color types in the column order of _COLOR_TABLE
+_COLOR_TYPES = ("primary", "secondary", "tertiary", "quaternary")
+
+# Row of each team in _COLOR_TABLE
+_TEAM_INDEX = {team: row for row, team in enumerate(NFL_TEAM_COLORS)}
+
+# RGBA floats for every team and color type, parsed from hex once at import
+# so matplotlib-facing code can skip re-parsing hex strings on every call
+_COLOR_TABLE = np.array(
+    [
+        [mcolors.to_rgba(colors[color_type]) for color_type in _COLOR_TYPES]
+        for colors in NFL_TEAM_COLORS.values()
+    ]
+)
+_COLOR_TABLE.flags.writeable = False
+
 
 class NFLColorPalette:
     """Manages NFL team colors and creates color palettes for visualization."""
@@ -384,21 +407,7 @@ class NFLColorPalette:
         Returns:
             List of hex color codes forming gradient
         """
-        color1 = self.get_team_colors(team1, color_type)
-        color2 = self.get_team_colors(team2, color_type)
-
-        # Convert to RGB
-        rgb1 = mcolors.hex2color(color1)
-        rgb2 = mcolors.hex2color(color2)
-
-        # Create gradient
-        gradient_colors = []
-        for i in range(n_colors):
-            ratio = i / (n_colors - 1)
-            rgb = tuple(rgb1[j] * (1 - ratio) + rgb2[j] * ratio for j in range(3))
-            gradient_colors.append(mcolors.rgb2hex(rgb))
-
-        return gradient_colors
+        return list(_gradient(team1.upper(), team2.upper(), n_colors, color_type))
 
     def create_conference_palette(
         self, conference: str = "NFL", color_type: str = "primary"
@@ -412,15 +421,7 @@ class NFLColorPalette:
         Returns:
             Dictionary mapping team abbreviations to hex color codes
         """
-        from .logos import get_available_teams, get_conference_teams
-
-        if conference.upper() == "NFL":
-            teams = get_available_teams()
-        else:
-            teams = get_conference_teams(conference)
-
-        colors = self.create_team_palette(teams, color_type)
-        return dict(zip(teams, colors))
+        return dict(_conference_palette(conference.upper(), color_type))
 
     def create_division_palette(
         self, division: str, color_type: str = "primary"
@@ -434,30 +435,14 @@ class NFLColorPalette:
         Returns:
             Dictionary mapping team abbreviations to hex color codes
 
+        Raises:
+            ValueError: If division is invalid
+
         Note:
             This is a simplified implementation. Real implementation would
             need to load division mappings from nfl_data_py.
         """
-        # Simplified division mappings - in production, load from data
-        divisions = {
-            "AFC EAST": ["BUF", "MIA", "NE", "NYJ"],
-            "AFC NORTH": ["BAL", "CIN", "CLE", "PIT"],
-            "AFC SOUTH": ["HOU", "IND", "JAC", "TEN"],
-            "AFC WEST": ["DEN", "KC", "LV", "LAC"],
-            "NFC EAST": ["DAL", "NYG", "PHI", "WAS"],
-            "NFC NORTH": ["CHI", "DET", "GB", "MIN"],
-            "NFC SOUTH": ["ATL", "CAR", "NO", "TB"],
-            "NFC WEST": ["ARI", "LAR", "SEA", "SF"],
-        }
-
-        division = division.upper()
-        if division not in divisions:
-            msg = f"Invalid division: {division}"
-            raise ValueError(msg)
-
-        teams = divisions[division]
-        colors = self.create_team_palette(teams, color_type)
-        return dict(zip(teams, colors))
+        return dict(_division_palette(division.upper(), color_type))
 
     def get_contrasting_color(self, team: str, background: str = "white") -> str:
         """Get contrasting color for text over team color.
@@ -538,12 +523,123 @@ def get_palette_manager() -> NFLColorPalette:
     return _palette_manager
 
 
+@lru_cache(maxsize=256)
+def _get_team_color(team: str, color_type: str) -> str:
+    """Look up a single team color, memoized on (team, color_type)."""
+    if color_type not in ["primary", "secondary", "tertiary", "quaternary"]:
+        msg = f"Invalid color_type: {color_type}"
+        raise ValueError(msg)
+
+    team = team.upper()
+    if team not in NFL_TEAM_COLORS:
+        msg = f"Invalid team abbreviation: {team}"
+        raise ValueError(msg)
+
+    return NFL_TEAM_COLORS[team][color_type]
+
+
+def _team_rgba(teams: Iterable[str], color_type: str) -> np.ndarray:
+    """Look up RGBA rows for teams in the precomputed color table.
+
+    Args:
+        teams: Team abbreviations
+        color_type: Type of color ('primary', 'secondary', 'tertiary', 'quaternary')
+
+    Returns:
+        New (N, 4) float array with one RGBA row per team
+
+    Raises:
+        ValueError: If team or color_type is invalid
+    """
+    if color_type not in _COLOR_TYPES:
+        msg = f"Invalid color_type: {color_type}"
+        raise ValueError(msg)
+
+    try:
+        rows = [_TEAM_INDEX[team.upper()] for team in teams]
+    except KeyError as e:
+        msg = f"Invalid team abbreviation: {e.args[0]}"
+        raise ValueError(msg) from None
+
+    return _COLOR_TABLE[rows, _COLOR_TYPES.index(color_type)]
+
+
+@lru_cache(maxsize=512)
+def _team_colors(teams: tuple[str, ...], color_type: str) -> tuple[str, ...]:
+    """Look up colors for a sequence of teams, memoized on (teams, color_type)."""
+    # Checked up front so an empty team list still rejects a bad color_type
+    if color_type not in ["primary", "secondary", "tertiary", "quaternary"]:
+        msg = f"Invalid color_type: {color_type}"
+        raise ValueError(msg)
+    return tuple(_get_team_color(team, color_type) for team in teams)
+
+
+# Simplified division mappings - in production, load from data
+_DIVISION_TEAMS: dict[str, list[str]] = {
+    "AFC EAST": ["BUF", "MIA", "NE", "NYJ"],
+    "AFC NORTH": ["BAL", "CIN", "CLE", "PIT"],
+    "AFC SOUTH": ["HOU", "IND", "JAC", "TEN"],
+    "AFC WEST": ["DEN", "KC", "LV", "LAC"],
+    "NFC EAST": ["DAL", "NYG", "PHI", "WAS"],
+    "NFC NORTH": ["CHI", "DET", "GB", "MIN"],
+    "NFC SOUTH": ["ATL", "CAR", "NO", "TB"],
+    "NFC WEST": ["ARI", "LAR", "SEA", "SF"],
+}
+
+
+@lru_cache(maxsize=128)
+def _gradient(
+    team1: str, team2: str, n_colors: int, color_type: str
+) -> tuple[str, ...]:
+    """Build a memoized gradient between two team colors."""
+    # Convert to RGB
+    rgb1 = mcolors.hex2color(_get_team_color(team1, color_type))
+    rgb2 = mcolors.hex2color(_get_team_color(team2, color_type))
+
+    # Create gradient
+    gradient_colors = []
+    for i in range(n_colors):
+        ratio = i / (n_colors - 1)
+        rgb = tuple(rgb1[j] * (1 - ratio) + rgb2[j] * ratio for j in range(3))
+        gradient_colors.append(mcolors.rgb2hex(rgb))
+
+    return tuple(gradient_colors)
+
+
+@lru_cache(maxsize=16)
+def _conference_palette(
+    conference: str, color_type: str
+) -> tuple[tuple[str, str], ...]:
+    """Build memoized (team, color) pairs for a conference or the whole NFL."""
+    from .logos import get_available_teams, get_conference_teams
+
+    if conference == "NFL":
+        teams = get_available_teams()
+    else:
+        teams = get_conference_teams(conference)
+
+    return tuple((team, _get_team_color(team, color_type)) for team in teams)
+
+
+@lru_cache(maxsize=64)
+def _division_palette(division: str, color_type: str) -> tuple[tuple[str, str], ...]:
+    """Build memoized (team, color) pairs for a division."""
+    if division not in _DIVISION_TEAMS:
+        msg = f"Invalid division: {division}"
+        raise ValueError(msg)
+
+    return tuple(
+        (team, _get_team_color(team, color_type)) for team in _DIVISION_TEAMS[division]
+    )
+
+
 def get_team_colors(
     teams: str | list[str], color_type: str = "primary"
 ) -> str | list[str]:
     """Get colors for specified teams.
 
-    Convenience function using singleton palette manager.
+    Convenience function backed by a memoized per-team lookup of
+    NFL_TEAM_COLORS.
 
     Args:
         teams: Team abbreviation(s)
@@ -551,9 +647,15 @@ def get_team_colors(
 
     Returns:
         Color hex code(s)
+
+    Raises:
+        ValueError: If team or color_type is invalid
     """
-    manager = get_palette_manager()
-    return manager.get_team_colors(teams, color_type)
+    if isinstance(teams, str):
+        return _get_team_color(teams, color_type)
+
+    colors = list(_team_colors(tuple(teams), color_type))
+    return colors[0] if len(colors) == 1 else colors
 
 
 def create_nfl_colormap(
@@ -561,6 +663,9 @@ def create_nfl_colormap(
 ) -> mcolors.ListedColormap:
     """Create matplotlib colormap from NFL team colors.
 
+    Colormaps are memoized per team sequence and color type, so repeated calls
+    return the same shared object - copy it before mutating.
+
     Args:
         teams: List of team abbreviations
         color_type: Type of color to use
@@ -568,5 +673,10 @@ def create_nfl_colormap(
     Returns:
         matplotlib ListedColormap
     """
-    manager = get_palette_manager()
-    return manager.to_matplotlib_colormap(teams, color_type)
+    return _team_colormap(tuple(teams), color_type)
+
+
+@lru_cache(maxsize=32)
+def _team_colormap(teams: tuple[str, ...], color_type: str) -> mcolors.ListedColormap:
+    """Build a memoized colormap for an ordered team sequence."""
+    return get_palette_manager().to_matplotlib_colormap(list(teams), color_type)
@@ -180,8 +180,6 @@ class NFLDataPlayerManager:
             return self._cache[cache_key]
 
         try:
-            import pandas as pd
-
             # Map ID type to column name
             column_map = {"gsis": "gsis_id", "espn": "espn_id", "nfl": "nfl_id"}
 
@@ -200,24 +198,7 @@ class NFLDataPlayerManager:
             matches = self._id_data[self._id_data[column_name] == search_id]
 
             if not matches.empty:
-                player_row = matches.iloc[0]
-                result = {
-                    "gsis_id": str(player_row["gsis_id"])
-                    if pd.notna(player_row["gsis_id"])
-                    else None,
-                    "espn_id": str(int(player_row["espn_id"]))
-                    if pd.notna(player_row["espn_id"])
-                    else None,
-                    "name": str(player_row["name"])
-                    if pd.notna(player_row["name"])
-                    else None,
-                    "team": str(player_row["team"])
-                    if pd.notna(player_row.get("team"))
-                    else None,
-                    "position": str(player_row["position"])
-                    if pd.notna(player_row.get("position"))
-                    else None,
-                }
+                result = self._player_info(matches.iloc[0])
                 self._cache[cache_key] = result
                 return result
 
@@ -231,6 +212,92 @@ class NFLDataPlayerManager:
         self._cache[cache_key] = result
         return result
 
+    def get_players_info_by_ids(
+        self, player_ids: list[str], id_type: str = "gsis"
+    ) -> dict[str, dict[str, str | None]]:
+        """Get player info for many IDs with a single scan of the ID table.
+
+        Args:
+            player_ids: Player identifiers
+            id_type: Type of ID ('gsis', 'espn', 'nfl')
+
+        Returns:
+            Dictionary mapping each requested ID to its player information
+        """
+        empty = {"gsis_id": None, "espn_id": None, "name": None}
+        if not self._load_data():
+            return {player_id: dict(empty) for player_id in player_ids}
+
+        column_map = {"gsis": "gsis_id", "espn": "espn_id", "nfl": "nfl_id"}
+        column_name = column_map.get(id_type)
+
+        # Only IDs missing from the cache need to be searched for. Bad IDs warn
+        # and get an empty record, as with get_player_info_by_id.
+        pending = {}
+        for player_id in dict.fromkeys(player_ids):
+            cache_key = f"id:{id_type}:{player_id}"
+            if cache_key in self._cache:
+                continue
+            try:
+                if column_name is None:
+                    self._raise_unsupported_id_type(id_type)
+                # Ensure ESPN ID is numeric
+                search_id = float(player_id) if id_type == "espn" else player_id
+            except Exception as e:
+                warnings.warn(
+                    f"Error looking up player by {id_type} ID {player_id}: {e}",
+                    stacklevel=2,
+                )
+                self._cache[cache_key] = dict(empty)
+            else:
+                pending[search_id] = player_id
+
+        if pending:
+            found = {}
+            try:
+                matches = self._id_data[
+                    self._id_data[column_name].isin(list(pending))
+                ].drop_duplicates(column_name)
+                for player_row in matches.to_dict("records"):
+                    found[pending[player_row[column_name]]] = self._player_info(
+                        player_row
+                    )
+            except Exception as e:
+                warnings.warn(
+                    f"Error looking up players by {id_type} ID: {e}", stacklevel=2
+                )
+
+            for player_id in pending.values():
+                self._cache[f"id:{id_type}:{player_id}"] = found.get(
+                    player_id, dict(empty)
+                )
+
+        return {
+            player_id: self._cache[f"id:{id_type}:{player_id}"]
+            for player_id in player_ids
+        }
+
+    @staticmethod
+    def _player_info(player_row) -> dict[str, str | None]:
+        """Build the player info dictionary for one row of the ID table."""
+        import pandas as pd
+
+        return {
+            "gsis_id": str(player_row["gsis_id"])
+            if pd.notna(player_row["gsis_id"])
+            else None,
+            "espn_id": str(int(player_row["espn_id"]))
+            if pd.notna(player_row["espn_id"])
+            else None,
+            "name": str(player_row["name"]) if pd.notna(player_row["name"]) else None,
+            "team": str(player_row["team"])
+            if pd.notna(player_row.get("team"))
+            else None,
+            "position": str(player_row["position"])
+            if pd.notna(player_row.get("position"))
+            else None,
+        }
+
     def _raise_unsupported_id_type(self, id_type: str) -> None:
         """Raise ValueError for unsupported ID type."""
         msg = f"Unsupported ID type: {id_type}"
@@ -113,17 +113,17 @@ def _plot_team_stats_matplotlib(
     **kwargs,
 ) -> plt.Figure:
     """Create matplotlib team stats plot."""
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = plt.subplots(figsize=figsize, layout="constrained")
 
-    # Get team colors
     teams = data[team_column].tolist()
-    colors = get_team_colors(teams, "primary")
+    x_values = data[x].to_numpy()
+    y_values = data[y].to_numpy()
 
     if show_logos:
         # Create scatter plot with transparent markers for positioning
         ax.scatter(
-            data[x],
-            data[y],
+            x_values,
+            y_values,
             c="white",
             s=1,
             alpha=0.01,  # Nearly invisible
@@ -131,12 +131,13 @@ def _plot_team_stats_matplotlib(
         )
 
         # Add logos
-        add_nfl_logos(ax, teams, data[x].values, data[y].values, width=logo_size)
+        add_nfl_logos(ax, teams, x_values, y_values, width=logo_size)
     else:
-        # Regular scatter plot with team colors
+        # Single scatter collection with per-team face colors
+        colors = get_team_colors(teams, "primary")
         ax.scatter(
-            data[x],
-            data[y],
+            x_values,
+            y_values,
             c=colors,
             s=100,
             alpha=0.8,
@@ -148,11 +149,11 @@ def _plot_team_stats_matplotlib(
     # Add reference lines
     if add_reference_lines:
         if reference_type in ["median", "both"]:
-            add_median_lines(ax, data[x].values, axis="x", alpha=0.5)
-            add_median_lines(ax, data[y].values, axis="y", alpha=0.5)
+            add_median_lines(ax, x_values, axis="x", alpha=0.5)
+            add_median_lines(ax, y_values, axis="y", alpha=0.5)
         if reference_type in ["mean", "both"]:
-            add_mean_lines(ax, data[x].values, axis="x", alpha=0.5)
-            add_mean_lines(ax, data[y].values, axis="y", alpha=0.5)
+            add_mean_lines(ax, x_values, axis="x", alpha=0.5)
+            add_mean_lines(ax, y_values, axis="y", alpha=0.5)
 
     # Styling
     ax.set_xlabel(x.replace("_", " ").title(), fontsize=12)
@@ -167,7 +168,6 @@ def _plot_team_stats_matplotlib(
     # Add grid
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
     return fig
 
 
@@ -198,8 +198,8 @@ def _plot_team_stats_plotly(
     # Create scatter plot
     fig = create_team_scatter(
         teams=data[team_column].tolist(),
-        x=data[x].tolist(),
-        y=data[y].tolist(),
+        x=data[x].to_numpy(),
+        y=data[y].to_numpy(),
         show_logos=show_logos,
         logo_size=logo_size,
         **kwargs,
@@ -338,7 +338,9 @@ def _create_radar_chart(
 ) -> plt.Figure:
     """Create radar chart for player comparison."""
 
-    fig, ax = plt.subplots(figsize=(10, 10), subplot_kw={"projection": "polar"})
+    fig, ax = plt.subplots(
+        figsize=(10, 10), subplot_kw={"projection": "polar"}, layout="constrained"
+    )
 
     # Number of metrics
     N = len(metrics)
@@ -374,7 +376,6 @@ def _create_radar_chart(
     ax.legend(loc="upper right", bbox_to_anchor=(0.1, 0.1))
 
     plt.title("Player Comparison Radar Chart", size=16, fontweight="bold", pad=20)
-    plt.tight_layout()
 
     return fig
 
@@ -393,7 +394,9 @@ def _create_player_bar_chart(
     n_metrics = len(metrics)
     len(players)
 
-    fig, axes = plt.subplots(1, n_metrics, figsize=(4 * n_metrics, 6))
+    fig, axes = plt.subplots(
+        1, n_metrics, figsize=(4 * n_metrics, 6), layout="constrained"
+    )
     if n_metrics == 1:
         axes = [axes]
 
@@ -433,7 +436,6 @@ def _create_player_bar_chart(
             )
 
     plt.suptitle("Player Comparison", size=16, fontweight="bold")
-    plt.tight_layout()
 
     return fig
 
@@ -444,6 +444,29 @@ def get_player_info_by_id(
     return nfl_manager.get_player_info_by_id(player_id, id_type)
 
 
+def get_players_info_by_ids(
+    player_ids: list[str], id_type: str = "gsis"
+) -> dict[str, dict[str, str | None]]:
+    """Get player information for many IDs in one batch.
+
+    Args:
+        player_ids: Player identifiers
+        id_type: Type of ID ('gsis', 'espn', 'nfl')
+
+    Returns:
+        Dictionary mapping each ID to the same information returned by
+        get_player_info_by_id()
+
+    Example:
+        >>> infos = get_players_info_by_ids(["00-0033873", "00-0034857"])
+        >>> print(infos["00-0033873"]["espn_id"])  # "3139477"
+    """
+    from .nfl_data_integration import get_nfl_data_manager
+
+    nfl_manager = get_nfl_data_manager()
+    return nfl_manager.get_players_info_by_ids(player_ids, id_type)
+
+
 def validate_all_urls() -> dict[str, list[str]]:
     """Validate all managed URLs for accessibility.
 
@@ -457,8 +480,9 @@ def validate_all_urls() -> dict[str, list[str]]:
     import time
     from concurrent.futures import ThreadPoolExecutor, as_completed
 
-    import requests
+    from .assets import get_http_session
 
+    session = get_http_session()
     manager = get_url_manager()
     all_urls = {**manager.logos, **manager.wordmarks}
 
@@ -467,7 +491,7 @@ def validate_all_urls() -> dict[str, list[str]]:
 
     def check_url(url):
         try:
-            response = requests.head(url, timeout=10)
+            response = session.head(url, timeout=10)
             return url, response.status_code < 400
         except Exception:
             return url, False
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
@@ -10,6 +12,27 @@ import pandas as pd
 
 from .logos import get_available_teams, get_conference_teams
 
+# Fixed groupings, built once at import and shared read-only between callers
+_CONFERENCE_TIERS = MappingProxyType(
+    {
+        "AFC": tuple(get_conference_teams("AFC")),
+        "NFC": tuple(get_conference_teams("NFC")),
+    }
+)
+_DIVISION_TIERS = MappingProxyType(
+    {
+        "AFC East": ("BUF", "MIA", "NE", "NYJ"),
+        "AFC North": ("BAL", "CIN", "CLE", "PIT"),
+        "AFC South": ("HOU", "IND", "JAC", "TEN"),
+        "AFC West": ("DEN", "KC", "LV", "LAC"),
+        "NFC East": ("DAL", "NYG", "PHI", "WAS"),
+        "NFC North": ("CHI", "DET", "GB", "MIN"),
+        "NFC South": ("ATL", "CAR", "NO", "TB"),
+        "NFC West": ("ARI", "LAR", "SEA", "SF"),
+    }
+)
+_FACTOR_TEAMS = frozenset([*get_available_teams(), "AFC", "NFC", "NFL"])
+
 
 def team_factor(
     teams: list[str] | pd.Series, levels: list[str] | None = None
@@ -32,8 +55,7 @@ def team_factor(
         teams = teams.tolist()
 
     # Validate all teams
-    available_teams = [*get_available_teams(), "AFC", "NFC", "NFL"]
-    invalid_teams = [t for t in teams if t.upper() not in available_teams]
+    invalid_teams = [t for t in teams if t.upper() not in _FACTOR_TEAMS]
     if invalid_teams:
         msg = f"Invalid team abbreviations: {invalid_teams}"
         raise ValueError(msg)
@@ -44,16 +66,20 @@ def team_factor(
     # Set levels (categories)
     if levels is None:
         # Default alphabetical ordering of all NFL teams
-        levels = sorted(available_teams)
-    else:
-        levels = [t.upper() for t in levels]
+        levels = sorted(_FACTOR_TEAMS)
+
+    return pd.Categorical(teams, dtype=_team_dtype(tuple(t.upper() for t in levels)))
 
-    return pd.Categorical(teams, categories=levels, ordered=True)
+
+@lru_cache(maxsize=32)
+def _team_dtype(levels: tuple[str, ...]) -> pd.CategoricalDtype:
+    """Build the ordered team dtype once per distinct set of levels."""
+    return pd.CategoricalDtype(categories=levels, ordered=True)
 
 
 def team_tiers(
     method: str = "draft_order", season: int | None = None
-) -> dict[str, list[str]]:
+) -> dict[str, tuple[str, ...]]:
     """Create NFL team tiers based on various ranking methods.
 
     Equivalent to nflplotR's nfl_team_tiers().
@@ -64,7 +90,7 @@ def team_tiers(
         season: Season year for data-based methods (not used in basic implementation)
 
     Returns:
-        Dictionary mapping tier names to lists of team abbreviations
+        Dictionary mapping tier names to tuples of team abbreviations
 
     Raises:
         ValueError: If method is not supported
@@ -75,7 +101,7 @@ def team_tiers(
         # Reverse draft order (best teams first)
         # This is a simplified implementation - real version would use actual standings
         np.random.seed(42)  # For reproducible "random" draft order
-        shuffled_teams = np.random.permutation(available_teams).tolist()
+        shuffled_teams = tuple(np.random.permutation(available_teams).tolist())
 
         n_teams = len(shuffled_teams)
         tier_size = n_teams // 4
@@ -88,22 +114,14 @@ def team_tiers(
         }
 
     if method == "conference":
-        return {"AFC": get_conference_teams("AFC"), "NFC": get_conference_teams("NFC")}
+        return dict(_CONFERENCE_TIERS)
 
     if method == "division":
-        return {
-            "AFC East": ["BUF", "MIA", "NE", "NYJ"],
-            "AFC North": ["BAL", "CIN", "CLE", "PIT"],
-            "AFC South": ["HOU", "IND", "JAC", "TEN"],
-            "AFC West": ["DEN", "KC", "LV", "LAC"],
-            "NFC East": ["DAL", "NYG", "PHI", "WAS"],
-            "NFC North": ["CHI", "DET", "GB", "MIN"],
-            "NFC South": ["ATL", "CAR", "NO", "TB"],
-            "NFC West": ["ARI", "LAR", "SEA", "SF"],
-        }
+        return dict(_DIVISION_TIERS)
 
     if method == "random":
         np.random.shuffle(available_teams)
+        available_teams = tuple(available_teams)
         n_teams = len(available_teams)
         tier_size = n_teams // 4
 
@@ -137,12 +155,8 @@ def validate_teams(teams: str | list[str], allow_conferences: bool = True) -> li
     # Normalize to uppercase
     teams = [t.upper() for t in teams]
 
-    # Get valid teams
-    valid_teams = get_available_teams()
-    if allow_conferences:
-        valid_teams.extend(["AFC", "NFC", "NFL"])
-
     # Check for invalid teams
+    valid_teams = _valid_teams(allow_conferences)
     invalid_teams = [t for t in teams if t not in valid_teams]
     if invalid_teams:
         msg = f"Invalid team abbreviations: {invalid_teams}"
@@ -151,6 +165,15 @@ def validate_teams(teams: str | list[str], allow_conferences: bool = True) -> li
     return teams
 
 
+@lru_cache(maxsize=2)
+def _valid_teams(allow_conferences: bool) -> frozenset[str]:
+    """Build the set of accepted team abbreviations once per mode."""
+    valid_teams = frozenset(get_available_teams())
+    if allow_conferences:
+        valid_teams |= {"AFC", "NFC", "NFL"}
+    return valid_teams
+
+
 def get_team_info(teams: str | list[str] | None = None) -> pd.DataFrame:
     """Get comprehensive team information.
 
@@ -651,6 +674,23 @@ def clear_all_cache() -> None:
 
         manager.get_cache_info()
 
+        # Drop decoded logos held in memory as well
+        from nflplotpy.matplotlib.artists import _load_logo_array
+
+        _load_logo_array.cache_clear()
+
+        from nflplotpy.matplotlib.elements import (
+            _load_headshot_image,
+            _load_wordmark_array,
+        )
+
+        _load_headshot_image.cache_clear()
+        _load_wordmark_array.cache_clear()
+
+        from nflplotpy.pandas.styling import _logo_data_uri
+
+        _logo_data_uri.cache_clear()
+
     except Exception:
         pass
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
 from matplotlib.artist import Artist
+from matplotlib.axes import Axes
 from matplotlib.offsetbox import AnnotationBbox, OffsetImage
 from PIL import Image
 
@@ -13,6 +15,8 @@ from nflplotpy.core.logos import get_asset_manager, get_team_logo
 from nflplotpy.core.utils import validate_teams
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import matplotlib.pyplot as plt
 
 
@@ -45,6 +49,30 @@ def _raise_file_not_found(image_path) -> None:
     raise FileNotFoundError(msg)
 
 
+@lru_cache(maxsize=64)
+def _load_logo_array(team: str, target_width_pixels: int | None = None) -> np.ndarray:
+    """Decode a team logo to a numpy array, memoized per (team, width).
+
+    Args:
+        team: Uppercase team abbreviation
+        target_width_pixels: Width to resize to (keeping aspect ratio), or None
+            to keep the source resolution
+
+    Returns:
+        Read-only image array shared between callers
+    """
+    if target_width_pixels is None:
+        pil_image = get_team_logo(team)
+    else:
+        # Resized once and cached on disk at this width
+        pil_image = get_asset_manager().get_resized_logo(team, target_width_pixels)
+
+    image_array = np.array(pil_image)
+    # The same array is handed to every caller, so guard against mutation
+    image_array.flags.writeable = False
+    return image_array
+
+
 class NFLLogoArtist(Artist):
     """Custom matplotlib artist for rendering NFL logos."""
 
@@ -88,11 +116,8 @@ class NFLLogoArtist(Artist):
     def _load_logo(self):
         """Load the team logo image."""
         try:
-            # Get logo image
-            pil_image = get_team_logo(self.team)
-
-            # Convert to numpy array for matplotlib
-            image_array = np.array(pil_image)
+            # Get decoded logo image
+            image_array = _load_logo_array(self.team)
 
             # Create OffsetImage
             offset_image = OffsetImage(image_array, zoom=self.width, alpha=self.alpha)
@@ -148,32 +173,16 @@ def add_nfl_logo(
     validate_teams(team)
 
     try:
-        # Get logo image
-        pil_image = get_team_logo(team)
+        # Decoded (and, for adaptive sizing, pre-resized) logo from memory cache
+        image_array = _load_logo_array(team.upper(), target_width_pixels)
 
-        # For adaptive sizing, resize the PIL image first before converting to numpy
         if target_width_pixels is not None:
-            # Get original dimensions
-            orig_width, orig_height = pil_image.size
-
-            # Calculate new height maintaining aspect ratio
-            aspect_ratio = orig_height / orig_width
-            new_height = int(target_width_pixels * aspect_ratio)
-
-            # Resize the PIL image to exact target dimensions
-            pil_image = pil_image.resize(
-                (target_width_pixels, new_height), Image.Resampling.LANCZOS
-            )
-
-            # Now use zoom=1 since we've already resized
+            # Now use zoom=1 since the image is already at the target size
             zoom = 1.0
         else:
             # Fallback to old method with zoom scaling
             zoom = width * 10
 
-        # Convert PIL to numpy array after any resizing
-        image_array = np.array(pil_image)
-
         # Create OffsetImage with calculated zoom
         offset_image = OffsetImage(image_array, zoom=zoom, alpha=alpha)
 
@@ -333,32 +342,47 @@ def add_nfl_wordmark(
 
 
 def add_median_lines(
-    ax: plt.Axes, data: np.ndarray | list[float], axis: str = "both", **kwargs
+    ax: plt.Axes | Iterable[plt.Axes],
+    data: np.ndarray | list[float] | None = None,
+    axis: str = "both",
+    *,
+    value: float | None = None,
+    **kwargs,
 ):
     """Add median reference lines to plot.
 
     Equivalent to nflplotR's geom_median_lines().
 
     Args:
-        ax: Matplotlib axes
+        ax: Matplotlib axes, or a list/array of axes sharing the same median
         data: Data to calculate median from
         axis: Which axis to add lines ('x', 'y', 'both')
+        value: Precomputed median; skips the median calculation when given
         **kwargs: Arguments passed to axhline/axvline
-    """
-    if isinstance(data, list):
-        data = np.array(data)
 
-    median_val = np.median(data)
+    Raises:
+        ValueError: If neither data nor value is provided
+    """
+    if value is not None:
+        median_val = value
+    elif data is not None:
+        median_val = np.median(np.asarray(data))
+    else:
+        msg = "Either data or value must be provided"
+        raise ValueError(msg)
 
     # Default line styling
     line_kwargs = {"color": "red", "linestyle": "--", "alpha": 0.7, "linewidth": 1}
     line_kwargs.update(kwargs)
 
-    if axis in ["y", "both"]:
-        ax.axhline(y=median_val, **line_kwargs)
+    # Flatten so 2-D grids from plt.subplots(nrows, ncols) work as well
+    targets = [ax] if isinstance(ax, Axes) else np.asarray(ax, dtype=object).flat
+    for target in targets:
+        if axis in ["y", "both"]:
+            target.axhline(y=median_val, **line_kwargs)
 
-    if axis in ["x", "both"]:
-        ax.axvline(x=median_val, **line_kwargs)
+        if axis in ["x", "both"]:
+            target.axvline(x=median_val, **line_kwargs)
 
 
 def add_mean_lines(
@@ -758,15 +782,16 @@ def add_image_from_path(
     from io import BytesIO
     from pathlib import Path
 
-    import requests
     from matplotlib import colors as mcolors
     from PIL import ImageEnhance
 
+    from nflplotpy.core.assets import get_http_session
+
     try:
         # Load image from path or URL
         if path.startswith(("http://", "https://")):
             # Download from URL
-            response = requests.get(path, timeout=30)
+            response = get_http_session().get(path, timeout=30)
             response.raise_for_status()
             image = Image.open(BytesIO(response.content))
         else:
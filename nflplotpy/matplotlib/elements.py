@@ -8,11 +8,13 @@ element_nfl_logo() functionality.
 from __future__ import annotations
 
 import warnings
+from functools import lru_cache
 
 import matplotlib.pyplot as plt
 import numpy as np
 from PIL import Image
 
+from nflplotpy.core.assets import get_http_session
 from nflplotpy.core.colors import get_team_colors
 from nflplotpy.core.urls import get_player_headshot_urls, get_url_manager
 from nflplotpy.core.utils import validate_teams
@@ -20,6 +22,24 @@ from nflplotpy.core.utils import validate_teams
 from .artists import add_nfl_logo
 
 
+def _adjust_margins(fig: plt.Figure, **margins: float) -> None:
+    """Reserve figure margin space for image labels.
+
+    Figures drawn with a layout engine that manages its own spacing (such as
+    ``layout="constrained"``) already account for the label artists, so the
+    manual adjustment is skipped for them.
+
+    Args:
+        fig: Figure owning the labelled axes
+        **margins: Margin fractions forwarded to ``Figure.subplots_adjust``
+    """
+    get_layout_engine = getattr(fig, "get_layout_engine", None)
+    engine = get_layout_engine() if get_layout_engine else None
+    if engine is not None and not engine.adjust_compatible:
+        return
+    fig.subplots_adjust(**margins)
+
+
 def set_xlabel_with_logos(
     ax: plt.Axes,
     teams: list[str],
@@ -76,7 +96,7 @@ def set_xlabel_with_logos(
             warnings.warn(f"Could not add logo for {team}: {e}", stacklevel=2)
 
     # Adjust bottom margin to accommodate logos
-    plt.subplots_adjust(bottom=0.2)
+    _adjust_margins(ax.figure, bottom=0.2)
 
 
 def set_ylabel_with_logos(
@@ -135,7 +155,7 @@ def set_ylabel_with_logos(
             warnings.warn(f"Could not add logo for {team}: {e}", stacklevel=2)
 
     # Adjust left margin to accommodate logos
-    plt.subplots_adjust(left=0.2)
+    _adjust_margins(ax.figure, left=0.2)
 
 
 def set_title_with_logos(
@@ -437,34 +457,12 @@ def add_team_wordmark(
         transform: Coordinate transform to use
         **kwargs: Additional arguments for OffsetImage
     """
-    from io import BytesIO
-
-    import requests
     from matplotlib import offsetbox
 
     team = validate_teams(team)[0]
 
     try:
-        # Get wordmark URL
-        manager = get_url_manager()
-        wordmark_url = manager.get_wordmark_url(team)
-
-        # Download and load image
-        response = requests.get(wordmark_url, timeout=10)
-        response.raise_for_status()
-
-        wordmark_img = Image.open(BytesIO(response.content))
-
-        # Fix palette mode issues while preserving transparency
-        if wordmark_img.mode == "P":
-            # Palette mode can cause color mapping issues - convert to RGBA to preserve transparency
-            wordmark_img = wordmark_img.convert("RGBA")
-        elif wordmark_img.mode in ["RGBA", "LA", "PA"]:
-            # Already has alpha channel - just ensure RGBA mode
-            wordmark_img = wordmark_img.convert("RGBA")
-        else:
-            # RGB or other modes - convert to RGBA for consistent transparency
-            wordmark_img = wordmark_img.convert("RGBA")
+        wordmark_img = _load_wordmark_array(get_url_manager().get_wordmark_url(team))
 
         # Create OffsetImage
         imagebox = offsetbox.OffsetImage(
@@ -485,6 +483,81 @@ def add_team_wordmark(
         return None
 
 
+@lru_cache(maxsize=64)
+def _load_wordmark_array(wordmark_url: str) -> np.ndarray:
+    """Download and decode a team wordmark, memoized per URL.
+
+    Args:
+        wordmark_url: Wordmark image URL
+
+    Returns:
+        Read-only RGBA image array shared between callers
+    """
+    from io import BytesIO
+
+    response = get_http_session().get(wordmark_url, timeout=10)
+    response.raise_for_status()
+
+    # Palette and RGB sources are converted too, for consistent transparency
+    wordmark_img = Image.open(BytesIO(response.content)).convert("RGBA")
+
+    image_array = np.array(wordmark_img)
+    image_array.flags.writeable = False
+    return image_array
+
+
+@lru_cache(maxsize=128)
+def _load_headshot_image(headshot_url: str) -> Image.Image:
+    """Download and decode a player headshot, memoized per URL.
+
+    Args:
+        headshot_url: Headshot image URL
+
+    Returns:
+        Decoded PIL Image shared between callers
+    """
+    from io import BytesIO
+
+    response = get_http_session().get(headshot_url, timeout=10)
+    response.raise_for_status()
+
+    headshot_img = Image.open(BytesIO(response.content))
+    headshot_img.load()
+    return headshot_img
+
+
+def prefetch_player_headshots(
+    player_ids: list[str | int], id_type: str = "auto", max_workers: int = 8
+) -> int:
+    """Download player headshots concurrently so later plotting hits the cache.
+
+    Args:
+        player_ids: Player identifiers (ESPN ID, GSIS ID, or name)
+        id_type: Type of player identifier ('espn', 'gsis', 'name', 'auto')
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Number of headshots that were loaded successfully
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Deduplicate while preserving order so each headshot is fetched once
+    jobs = list(dict.fromkeys(player_ids))
+    if not jobs:
+        return 0
+
+    def fetch(player_id: str | int) -> bool:
+        try:
+            urls = get_player_headshot_urls(player_id, id_type=id_type)
+            _load_headshot_image(urls["espn_full"])
+        except Exception:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        return sum(executor.map(fetch, jobs))
+
+
 def add_player_headshot(
     ax: plt.Axes,
     player_id: str | int,
@@ -509,9 +582,6 @@ def add_player_headshot(
         circular: Whether to crop headshot to circular shape
         **kwargs: Additional arguments for OffsetImage
     """
-    from io import BytesIO
-
-    import requests
     from matplotlib import offsetbox
 
     try:
@@ -524,13 +594,8 @@ def add_player_headshot(
             )
             return None
 
-        headshot_url = urls["espn_full"]
-
-        # Download and load image
-        response = requests.get(headshot_url, timeout=10)
-        response.raise_for_status()
-
-        headshot_img = Image.open(BytesIO(response.content))
+        # Download and decode once per URL; later calls reuse the image
+        headshot_img = _load_headshot_image(urls["espn_full"])
 
         # Make circular if requested
         if circular:
@@ -661,7 +726,7 @@ def set_xlabel_with_wordmarks(
     # Dynamically adjust bottom margin based on content
     current_bottom = plt.rcParams.get("figure.subplot.bottom", 0.1)
     new_bottom = max(current_bottom, 0.25 if len(teams) > 16 else 0.2)
-    plt.subplots_adjust(bottom=new_bottom)
+    _adjust_margins(ax.figure, bottom=new_bottom)
 
 
 def replace_legend_text_with_logos(
@@ -9,18 +9,14 @@ from __future__ import annotations
 import os
 import tempfile
 import warnings
+from importlib.util import find_spec
 
 import matplotlib.figure
 import matplotlib.pyplot as plt
 import numpy as np
 
-try:
-    from IPython.display import Image as IPythonImage
-    from IPython.display import display
-
-    HAS_IPYTHON = True
-except ImportError:
-    HAS_IPYTHON = False
+# IPython is only needed for inline display, so defer its (slow) import
+HAS_IPYTHON = find_spec("IPython") is not None
 
 
 def nfl_preview(
@@ -93,6 +89,9 @@ def nfl_preview(
         # Display in notebook if requested and available
         if show_in_notebook and HAS_IPYTHON:
             try:
+                from IPython.display import Image as IPythonImage
+                from IPython.display import display
+
                 display(IPythonImage(save_path))
                 return None  # Don't return path since we displayed inline
             except Exception:
@@ -201,7 +200,7 @@ def preview_comparison(
     # Display all in notebook if available
     if HAS_IPYTHON and paths:
         try:
-            from IPython.display import HTML
+            from IPython.display import HTML, display
 
             html_content = '<div style="display: flex; flex-wrap: wrap;">'
             for i, path in enumerate(paths):
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
-
-from nflplotpy.core.colors import create_nfl_colormap, get_team_colors
+import numpy as np
+
+from nflplotpy.core.colors import (
+    _team_colors,
+    _team_rgba,
+    create_nfl_colormap,
+    get_team_colors,
+)
 from nflplotpy.core.utils import validate_teams
 
 if TYPE_CHECKING:
@@ -50,8 +57,8 @@ def set_team_colors(
     # Validate teams
     teams = validate_teams(teams)
 
-    # Get colors
-    colors = get_team_colors(teams, color_type)
+    # Get colors (always one per team, even for a single team)
+    colors = _team_colors(tuple(teams), color_type)
 
     # Create color mapping
     if data_values is None:
@@ -167,10 +174,15 @@ def _apply_dark_nfl_theme(ax: Axes, team: str | None = None, **kwargs):
     ax.grid(True, alpha=0.2, linestyle="-", linewidth=0.5, color="white")
     ax.set_axisbelow(True)
 
-    # Light spines
+    # Light spines, or the brightened team color when a team is given
+    spine_color = "#cccccc"
+    if team is not None:
+        team = validate_teams(team)[0]
+        spine_color = _brighten(get_team_colors(team, "primary"))
+
     for spine in ax.spines.values():
         spine.set_linewidth(1.5)
-        spine.set_color("#cccccc")
+        spine.set_color(spine_color)
 
     # Light ticks and labels
     ax.tick_params(
@@ -182,20 +194,12 @@ def _apply_dark_nfl_theme(ax: Axes, team: str | None = None, **kwargs):
         length=5,
     )
 
-    if team is not None:
-        team = validate_teams(team)[0]
-        primary_color = get_team_colors(team, "primary")
 
-        # Brighten team color for dark theme
-        import matplotlib.colors as mcolors
-
-        rgb = mcolors.hex2color(primary_color)
-        # Simple brightness adjustment
-        bright_rgb = tuple(min(1.0, c * 1.3) for c in rgb)
-        bright_color = mcolors.rgb2hex(bright_rgb)
-
-        for spine in ax.spines.values():
-            spine.set_color(bright_color)
+@lru_cache(maxsize=64)
+def _brighten(hex_color: str, factor: float = 1.3) -> str:
+    """Brighten a hex color for dark backgrounds, memoized per color."""
+    rgb = np.minimum(np.multiply(mcolors.hex2color(hex_color), factor), 1.0)
+    return mcolors.rgb2hex(rgb)
 
 
 def create_team_scatter_colors(
@@ -203,7 +207,7 @@ def create_team_scatter_colors(
     values: list[float] | None = None,
     color_type: str = "primary",
     colormap: str | None = None,
-) -> list[str]:
+) -> list[str] | np.ndarray:
     """Create colors for scatter plot points based on teams.
 
     Args:
@@ -213,22 +217,25 @@ def create_team_scatter_colors(
         colormap: Optional matplotlib colormap name
 
     Returns:
-        List of color values for each point
+        List of hex colors for each point, or an (N, 4) RGBA array when
+        values are given
     """
     if values is None:
         # Use team colors directly
-        return get_team_colors(teams, color_type)
+        return list(_team_colors(tuple(teams), color_type))
     # Use colormap with team color influence
     if colormap is None:
-        # Create custom colormap from team colors
-        unique_teams = list(set(teams))
+        # Create custom colormap from team colors; first-seen order keeps the
+        # memoized colormap key (and the colors) stable between runs
+        unique_teams = list(dict.fromkeys(teams))
         cmap = nfl_color_scale(unique_teams, color_type)
     else:
         cmap = plt.get_cmap(colormap)
 
-    # Normalize values
-    norm = mcolors.Normalize(vmin=min(values), vmax=max(values))
-    return [cmap(norm(v)) for v in values]
+    # Normalize and map every value in one vectorized colormap call
+    values = np.asarray(values, dtype=float)
+    norm = mcolors.Normalize(vmin=values.min(), vmax=values.max())
+    return cmap(norm(values))
 
 
 def add_team_color_legend(
@@ -251,8 +258,8 @@ def add_team_color_legend(
     # Validate teams
     teams = validate_teams(teams)
 
-    # Get colors
-    colors = get_team_colors(teams, color_type)
+    # Get pre-parsed RGBA colors (one row per team)
+    colors = _team_rgba(teams, color_type)
 
     # Create legend elements
     legend_elements = [
@@ -321,18 +328,14 @@ def scale_color_nfl(
         msg = f"Length of values ({len(keys)}) must match length of data ({len(teams)})"
         raise ValueError(msg)
 
-    # Get team colors
-    colors = get_team_colors(teams, color_type)
-
-    # Apply alpha if not 1.0
-    if alpha != 1.0:
-        import matplotlib.colors as mcolors
-
-        rgba_colors = []
-        for color in colors:
-            rgb = mcolors.hex2color(color)
-            rgba_colors.append((*rgb, alpha))
-        colors = rgba_colors
+    # Get team colors (always one per team, even for a single team)
+    if alpha == 1.0:
+        colors = list(_team_colors(tuple(teams), color_type))
+    else:
+        # Take pre-parsed RGBA rows and apply alpha to all of them at once
+        rgba = _team_rgba(teams, color_type)
+        rgba[:, 3] = alpha
+        colors = list(map(tuple, rgba.tolist()))
 
     # Create mapping
     color_mapping = dict(zip(keys, colors))
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import base64
 import warnings
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 
@@ -15,9 +16,33 @@ import pandas as pd
 from PIL import Image
 
 from nflplotpy.core.colors import get_team_colors
-from nflplotpy.core.logos import get_team_logo
+from nflplotpy.core.logos import get_team_logo, get_team_logo_url
 from nflplotpy.core.utils import validate_teams
 
+# Characters encoded per write when saving rendered HTML
+_WRITE_CHUNK = 1 << 20
+
+
+@lru_cache(maxsize=256)
+def _logo_data_uri(team: str, logo_height: int) -> str:
+    """Encode a team logo at the given height as a memoized PNG data URI."""
+    logo_img = get_team_logo(team)
+
+    # Resize to specified height, maintaining aspect ratio
+    aspect_ratio = logo_img.width / logo_img.height
+    new_width = int(logo_height * aspect_ratio)
+    # Table logos are tiny, so box-reduce close to size first and finish with a
+    # cheap bilinear pass instead of a full Lanczos over the source bitmap
+    logo_img = logo_img.resize(
+        (new_width, logo_height), Image.Resampling.BILINEAR, reducing_gap=3.0
+    )
+
+    # Convert to base64 for HTML embedding
+    img_buffer = BytesIO()
+    logo_img.save(img_buffer, format="PNG")
+    img_str = base64.b64encode(img_buffer.getvalue()).decode()
+    return f"data:image/png;base64,{img_str}"
+
 
 class NFLTableStyler:
     """Advanced styler for NFL-themed pandas tables."""
@@ -36,6 +61,7 @@ class NFLTableStyler:
         columns: str | list[str],
         logo_height: int = 25,
         replace_text: bool = True,
+        embed_logos: bool = True,
     ) -> NFLTableStyler:
         """Add team logos to specified columns.
 
@@ -43,6 +69,9 @@ class NFLTableStyler:
             columns: Column name(s) containing team abbreviations
             logo_height: Height of logos in pixels
             replace_text: If True, replace text with logo; if False, add logo alongside
+            embed_logos: If True, inline logos as base64 PNGs so the HTML is
+                self-contained; if False, link to the logo URLs so the browser
+                fetches and caches them instead
 
         Returns:
             Self for method chaining
@@ -55,9 +84,11 @@ class NFLTableStyler:
                 warnings.warn(f"Column '{col}' not found in DataFrame", stacklevel=2)
                 continue
 
-            # Apply logo formatting
+            # Build each distinct team's cell once so rendering is a dict lookup
+            format_cell = self._logo_formatter(logo_height, replace_text, embed_logos)
+            cells = {team: format_cell(team) for team in self.df[col].dropna().unique()}
             self.styler = self.styler.format(
-                self._logo_formatter(logo_height, replace_text), subset=[col]
+                lambda value, cells=cells: cells.get(value, value), subset=[col]
             )
 
         return self
@@ -101,25 +132,27 @@ class NFLTableStyler:
             warnings.warn("No valid team abbreviations found", stacklevel=2)
             return self
 
-        colors = get_team_colors(valid_teams, color_type)
-        color_map = dict(zip(valid_teams, colors))
-
-        def color_styler(row):
-            team = str(row[team_column])
-            if team in color_map:
-                color = color_map[team]
-                if apply_to == "background":
-                    return [
-                        f"background-color: {color}" if col in columns else ""
-                        for col in row.index
-                    ]
-                # text
-                return [
-                    f"color: {color}" if col in columns else "" for col in row.index
-                ]
-            return ["" for _ in row.index]
-
-        self.styler = self.styler.apply(color_styler, axis=1)
+        color_map = {team: get_team_colors(team, color_type) for team in valid_teams}
+
+        columns = [col for col in columns if col in self.df.columns]
+        if not columns:
+            return self
+
+        # Build the CSS for every row in one vectorized pass and apply it to
+        # the target columns at once, instead of a Python callback per row
+        css_property = "background-color" if apply_to == "background" else "color"
+        row_css = (
+            (css_property + ": " + self.df[team_column].astype(str).map(color_map))
+            .fillna("")
+            .to_numpy()
+        )
+
+        def color_styler(frame):
+            return pd.DataFrame(
+                dict.fromkeys(frame.columns, row_css), index=frame.index
+            )
+
+        self.styler = self.styler.apply(color_styler, axis=None, subset=columns)
         return self
 
     def with_nfl_theme(
@@ -183,7 +216,9 @@ class NFLTableStyler:
 
         return self
 
-    def _logo_formatter(self, logo_height: int, replace_text: bool):
+    def _logo_formatter(
+        self, logo_height: int, replace_text: bool, embed_logos: bool = True
+    ):
         """Create formatter function for team logos."""
 
         def format_cell(team_abbr):
@@ -194,29 +229,20 @@ class NFLTableStyler:
                 team_abbr = str(team_abbr).upper()
                 validate_teams(team_abbr)
 
-                # Get logo image
-                logo_img = get_team_logo(team_abbr)
-
-                # Resize to specified height, maintaining aspect ratio
-                aspect_ratio = logo_img.width / logo_img.height
-                new_width = int(logo_height * aspect_ratio)
-                logo_img = logo_img.resize(
-                    (new_width, logo_height), Image.Resampling.LANCZOS
-                )
-
-                # Convert to base64 for HTML embedding
-                img_buffer = BytesIO()
-                logo_img.save(img_buffer, format="PNG")
-                img_str = base64.b64encode(img_buffer.getvalue()).decode()
+                if embed_logos:
+                    # Resized and encoded once per team/height, then reused
+                    logo_uri = _logo_data_uri(team_abbr, logo_height)
+                else:
+                    logo_uri = get_team_logo_url(team_abbr)
 
                 # Create HTML img tag
                 if replace_text:
                     return (
-                        f'<img src="data:image/png;base64,{img_str}" '
+                        f'<img src="{logo_uri}" '
                         f'height="{logo_height}px" alt="{team_abbr}">'
                     )
                 return (
-                    f'{team_abbr} <img src="data:image/png;base64,{img_str}" '
+                    f'{team_abbr} <img src="{logo_uri}" '
                     f'height="{logo_height}px" alt="{team_abbr}">'
                 )
 
@@ -245,7 +271,12 @@ class NFLTableStyler:
             **kwargs: Arguments passed to to_html()
         """
         html_content = self.to_html(**kwargs)
-        Path(filename).write_text(html_content, encoding="utf-8")
+        # Encode slice by slice so a large table never holds a second full copy
+        with Path(filename).open("wb", buffering=_WRITE_CHUNK) as fh:
+            fh.writelines(
+                html_content[start : start + _WRITE_CHUNK].encode("utf-8")
+                for start in range(0, len(html_content), _WRITE_CHUNK)
+            )
 
 
 def style_with_logos(
@@ -253,6 +284,7 @@ def style_with_logos(
     team_columns: str | list[str],
     logo_height: int = 25,
     replace_text: bool = True,
+    embed_logos: bool = True,
 ):
     """Add team logos to DataFrame columns.
 
@@ -263,6 +295,7 @@ def style_with_logos(
         team_columns: Column name(s) containing team abbreviations
         logo_height: Height of logos in pixels
         replace_text: If True, replace text with logo
+        embed_logos: If False, link to logo URLs instead of inlining base64
 
     Returns:
         pandas Styler with logo formatting
@@ -273,7 +306,9 @@ def style_with_logos(
         >>> styled.to_html('nfl_table.html')
     """
     styler = NFLTableStyler(df)
-    return styler.with_team_logos(team_columns, logo_height, replace_text).styler
+    return styler.with_team_logos(
+        team_columns, logo_height, replace_text, embed_logos
+    ).styler
 
 
 def style_with_headshots(
@@ -339,7 +374,11 @@ def style_with_headshots(
 
     for col in player_columns:
         if col in df.columns:
-            styler = styler.format(headshot_formatter, subset=[col])
+            # Resolve each distinct player once; rendering is then a lookup
+            cells = {p: headshot_formatter(p) for p in df[col].dropna().unique()}
+            styler = styler.format(
+                lambda value, cells=cells: cells.get(value, value), subset=[col]
+            )
 
     return styler
 
@@ -401,7 +440,11 @@ def style_with_wordmarks(
 
     for col in team_columns:
         if col in df.columns:
-            styler = styler.format(wordmark_formatter, subset=[col])
+            # Build each distinct team's cell once; rendering is then a lookup
+            cells = {t: wordmark_formatter(t) for t in df[col].dropna().unique()}
+            styler = styler.format(
+                lambda value, cells=cells: cells.get(value, value), subset=[col]
+            )
 
     return styler
 
@@ -412,6 +455,8 @@ def create_nfl_table(
     logo_columns: str | list[str] | None = None,
     color_columns: str | list[str] | None = None,
     title: str | None = None,
+    *,
+    embed_logos: bool = True,
     **kwargs,
 ) -> NFLTableStyler:
     """Create a comprehensive NFL-styled table.
@@ -425,6 +470,7 @@ def create_nfl_table(
         logo_columns: Columns to add logos to (defaults to team_column)
         color_columns: Columns to apply team colors to
         title: Table title
+        embed_logos: If False, link to logo URLs instead of inlining base64
         **kwargs: Additional styling arguments
 
     Returns:
@@ -457,7 +503,7 @@ def create_nfl_table(
 
         for col in logo_columns:
             if col in df.columns:
-                styler = styler.with_team_logos(col)
+                styler = styler.with_team_logos(col, embed_logos=embed_logos)
 
         # Add team colors
         if color_columns:
@@ -172,8 +172,8 @@ def add_nfl_headshot_trace(
 
 def create_team_scatter(
     teams: list[str],
-    x: list[float],
-    y: list[float],
+    x: list[float] | np.ndarray,
+    y: list[float] | np.ndarray,
     color_type: str = "primary",
     show_logos: bool = True,
     logo_size: float = 0.05,
@@ -202,6 +202,10 @@ def create_team_scatter(
 
     teams = validate_teams(teams)
 
+    # Hand plotly contiguous float arrays - they serialize much faster than lists
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
     # Get team colors
     colors = get_team_colors(teams, color_type)
 
@@ -412,14 +416,15 @@ def add_image_from_path_trace(
     """
     from pathlib import Path
 
-    import requests
     from PIL import Image
 
+    from nflplotpy.core.assets import get_http_session
+
     try:
         # Load image from path or URL
         if path.startswith(("http://", "https://")):
             # Download from URL
-            response = requests.get(path, timeout=30)
+            response = get_http_session().get(path, timeout=30)
             response.raise_for_status()
             image = Image.open(BytesIO(response.content))
         else:
@@ -0,0 +1,36 @@
+"""Shared pytest fixtures for nflplotpy tests."""
+
+from io import BytesIO
+
+import pytest
+
+
+@pytest.fixture
+def fake_http_session(monkeypatch):
+    """Serve a fixed PNG in place of the element downloads' HTTP session.
+
+    Returns a function that takes the PIL image to serve and returns the list
+    that every requested URL is appended to.
+    """
+    from nflplotpy.matplotlib import elements
+
+    def serve(image):
+        buf = BytesIO()
+        image.save(buf, format="PNG")
+        calls = []
+
+        class FakeResponse:
+            content = buf.getvalue()
+
+            def raise_for_status(self):
+                pass
+
+        class FakeSession:
+            def get(self, url, timeout=None):
+                calls.append(url)
+                return FakeResponse()
+
+        monkeypatch.setattr(elements, "get_http_session", FakeSession)
+        return calls
+
+    return serve
@@ -140,6 +140,10 @@ class TestColors:
         colors = get_team_colors(["ARI", "ATL"])
         assert isinstance(colors, list)
 
+        for teams in ("ARI", ["ARI", "ATL"], []):
+            with pytest.raises(ValueError, match="Invalid color_type"):
+                get_team_colors(teams, "bad")
+
     def test_create_nfl_colormap(self):
         """Test matplotlib colormap creation."""
         teams = ["ARI", "ATL", "BAL"]
@@ -149,6 +153,34 @@ class TestColors:
         assert hasattr(cmap, "colors")
         assert len(cmap.colors) == len(teams)
 
+    def test_create_nfl_colormap_memoized(self):
+        """Test that the same team sequence reuses one colormap."""
+        cmap = create_nfl_colormap(["KC", "SF"])
+
+        assert create_nfl_colormap(("KC", "SF")) is cmap
+        assert create_nfl_colormap(["SF", "KC"]).colors == cmap.colors[::-1]
+
+    def test_team_rgba_matches_hex_colors(self):
+        """Test that the precomputed RGBA table agrees with the hex colors."""
+        import matplotlib.colors as mcolors
+
+        from nflplotpy.core.colors import _COLOR_TABLE, _team_rgba
+
+        rgba = _team_rgba(["kc", "SF"], "secondary")
+
+        assert rgba.shape == (2, 4)
+        np.testing.assert_array_equal(
+            rgba,
+            [mcolors.to_rgba(get_team_colors(t, "secondary")) for t in ["KC", "SF"]],
+        )
+        assert not _COLOR_TABLE.flags.writeable
+        rgba[:, 3] = 0.5  # Lookups return a copy the caller may modify
+
+        with pytest.raises(ValueError, match="Invalid team"):
+            _team_rgba(["XXX"], "primary")
+        with pytest.raises(ValueError, match="Invalid color_type"):
+            _team_rgba(["KC"], "fifth")
+
     def test_gradient_creation(self):
         """Test color gradient creation."""
         palette = get_palette_manager()
@@ -159,6 +191,21 @@ class TestColors:
         for color in gradient:
             assert color.startswith("#")
 
+    def test_memoized_palettes_return_fresh_copies(self):
+        """Test that cached palettes can't be mutated through the result."""
+        palette = get_palette_manager()
+
+        division = palette.create_division_palette("nfc west")
+        division["KC"] = "#000000"
+        gradient = palette.create_gradient("ARI", "ATL", n_colors=5)
+        gradient.clear()
+
+        assert "KC" not in palette.create_division_palette("NFC West")
+        assert len(palette.create_gradient("ari", "atl", n_colors=5)) == 5
+
+        with pytest.raises(ValueError):
+            palette.create_division_palette("AFC Central")
+
 
 class TestUtils:
     """Test utility functions."""
@@ -185,6 +232,21 @@ class TestUtils:
         with pytest.raises(ValueError):
             team_tiers(method="invalid")
 
+    def test_team_tiers_cached_copies(self):
+        """Test that the shared static tiers can't be mutated through the result."""
+        tiers = team_tiers(method="division")
+        tiers["AFC East"] = ("KC",)
+
+        assert isinstance(tiers["NFC West"], tuple)
+        assert team_tiers(method="division")["AFC East"] == ("BUF", "MIA", "NE", "NYJ")
+
+    def test_team_factor_custom_levels(self):
+        """Test that custom levels are normalized and keep their order."""
+        factor = team_factor(["kc", "buf"], levels=["kc", "buf"])
+
+        assert list(factor.categories) == ["KC", "BUF"]
+        assert factor.ordered
+
     def test_validate_teams(self):
         """Test team validation."""
         teams = validate_teams(["ARI", "ATL"])
@@ -238,6 +300,30 @@ class TestAssets:
             manager.clear_cache()
             # Should not error even with empty cache
 
+    def test_cache_info_counts_files_only(self):
+        """Test cache info counts files and sizes but skips subdirectories."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = NFLAssetManager(cache_dir=tmpdir)
+            (manager.logos_dir / "KC_logo.png").write_bytes(b"x" * 10)
+            (manager.logos_dir / "BUF_logo.png").write_bytes(b"x" * 5)
+            (manager.wordmarks_dir / "KC_wordmark.png").write_bytes(b"x" * 7)
+            (manager.logos_dir / "nested").mkdir()
+
+            info = manager.get_cache_info()
+            assert info["logos_count"] == 2
+            assert info["headshots_count"] == 0
+            assert info["wordmarks_count"] == 1
+            assert info["total_size_bytes"] == 22
+
+            manager.clear_cache("logos")
+            info = manager.get_cache_info()
+            assert info["logos_count"] == 0
+            assert info["wordmarks_count"] == 1
+            assert (manager.logos_dir / "nested").is_dir()
+
+            with pytest.raises(ValueError, match="Invalid asset_type"):
+                manager.clear_cache("helmets")
+
 
 class TestIntegration:
     """Integration tests."""
@@ -252,6 +338,16 @@ class TestIntegration:
         assert hasattr(nflplotpy, "add_nfl_logo")
         assert hasattr(nflplotpy, "get_team_colors")
 
+    def test_optional_backends_resolve_lazily(self):
+        """Test that optional backends are importable as package attributes."""
+        import nflplotpy
+
+        with pytest.raises(AttributeError):
+            nflplotpy.not_a_module  # noqa: B018
+
+        pytest.importorskip("plotly")
+        assert callable(nflplotpy.plotly.create_team_scatter)
+
     @pytest.mark.parametrize("team", ["ARI", "ATL", "BAL", "BUF", "CAR"])
     def test_team_data_consistency(self, team):
         """Test that team data is consistent across modules."""
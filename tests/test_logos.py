@@ -86,6 +86,180 @@ class test_logo_downloading(TestCase):
                 except (OSError, PermissionError):
                     pass  # Cleanup failed but test completed successfully
 
+    def test_prefetch_populates_cache(self):
+        """Test that prefetch fetches each team asset once and caches it."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = NFLAssetManager(cache_dir=temp_dir)
+
+            # Wordmarks use local placeholders, so no network is needed
+            results = manager.prefetch(["KC", "gb", "KC"], kinds=("wordmark",))
+
+            self.assertEqual(
+                list(results.keys()), [("KC", "wordmark"), ("GB", "wordmark")]
+            )
+            for image in results.values():
+                self.assertIsInstance(image, Image.Image)
+            self.assertEqual(manager.get_cache_info()["wordmarks_count"], 2)
+
+            with self.assertRaises(ValueError):
+                manager.prefetch(["KC"], kinds=("mascot",))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_get_logos_downloads_each_team_once(self):
+        """Test that bulk logo loading fetches uncached teams once each."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = NFLAssetManager(cache_dir=temp_dir)
+            downloaded = []
+
+            def fake_download(url, cache_path, timeout=30):
+                downloaded.append(cache_path.name)
+                image = Image.new("RGBA", (10, 10))
+                image.save(cache_path)
+                return image
+
+            manager._download_image = fake_download
+
+            logos = manager.get_logos(["KC", "gb", "KC"])
+            self.assertEqual(list(logos), ["KC", "GB"])
+            for image in logos.values():
+                self.assertIsInstance(image, Image.Image)
+            self.assertEqual(sorted(downloaded), ["GB_logo.png", "KC_logo.png"])
+
+            # Cached logos are read back without downloading again
+            manager.get_logos(["KC", "GB"])
+            self.assertEqual(len(downloaded), 2)
+
+            with self.assertRaises(ValueError):
+                manager.get_logos(["KC", "XXX"])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_download_streams_to_cache(self):
+        """Test that downloads stream to disk and never leave partial files."""
+        from io import BytesIO
+        from unittest import mock
+
+        import requests
+
+        buf = BytesIO()
+        Image.new("RGBA", (12, 8), (0, 0, 255, 255)).save(buf, format="PNG")
+        payload = buf.getvalue()
+
+        class FakeResponse:
+            def __init__(self, fail, during):
+                self.fail = fail
+                self.during = during
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size):
+                yield payload[:10]
+                if self.during is not None:
+                    self.during()
+                if self.fail:
+                    msg = "connection dropped"
+                    raise requests.ConnectionError(msg)
+                yield payload[10:]
+
+        class FakeSession:
+            def __init__(self, fail=False, during=None):
+                self.fail = fail
+                self.during = during
+
+            def get(self, url, timeout=None, stream=False):
+                assert stream
+                return FakeResponse(self.fail, self.during)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = NFLAssetManager(cache_dir=temp_dir)
+            cache_path = manager.logos_dir / "KC_logo.png"
+
+            with mock.patch(
+                "nflplotpy.core.assets.get_http_session", return_value=FakeSession()
+            ):
+                logo = manager.get_logo("KC")
+            self.assertEqual(logo.size, (12, 8))
+            logo.close()
+            self.assertEqual(cache_path.read_bytes(), payload)
+
+            failed_path = manager.logos_dir / "GB_logo.png"
+            with mock.patch(
+                "nflplotpy.core.assets.get_http_session",
+                return_value=FakeSession(fail=True),
+            ), self.assertRaises(requests.RequestException):
+                manager.get_logo("GB")
+            self.assertFalse(failed_path.exists())
+            self.assertEqual(list(manager.logos_dir.glob("*.part")), [])
+
+            # A second download of the same asset finishing while the first
+            # is still streaming must not corrupt or break either of them
+            overlap_path = manager.logos_dir / "BUF_logo.png"
+            url = "https://example.com/BUF.png"
+
+            with mock.patch("nflplotpy.core.assets.get_http_session") as patched:
+
+                def overlapping_download():
+                    patched.return_value = FakeSession()
+                    manager._download_image(url, overlap_path).close()
+
+                patched.return_value = FakeSession(during=overlapping_download)
+                manager._download_image(url, overlap_path).close()
+            self.assertEqual(overlap_path.read_bytes(), payload)
+            self.assertEqual(list(manager.logos_dir.glob("*.part")), [])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_http_session_is_shared_and_retries(self):
+        """Test that downloads share one pooled session with retries."""
+        from nflplotpy.core.assets import get_http_session
+
+        session = get_http_session()
+        self.assertIs(session, get_http_session())
+
+        adapter = session.get_adapter("https://example.com")
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertIn("nflplotpy", session.headers["User-Agent"])
+
+    def test_get_resized_logo_caches_at_target_width(self):
+        """Test that resized logos are written to the cache at their size."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manager = NFLAssetManager(cache_dir=temp_dir)
+
+            # Seed the original logo so no download is needed
+            Image.new("RGBA", (200, 100), (255, 0, 0, 255)).save(
+                manager.logos_dir / "KC_logo.png"
+            )
+
+            resized = manager.get_resized_logo("kc", 50)
+            self.assertEqual(resized.size, (50, 25))
+            self.assertEqual(resized.mode, "RGBA")
+            self.assertTrue((manager.resized_logos_dir / "KC_logo_50px.png").exists())
+            self.assertEqual(list(manager.resized_logos_dir.glob("*.part")), [])
+            # Size variants are not counted as extra logos
+            self.assertEqual(manager.get_cache_info()["logos_count"], 1)
+
+            cached = manager.get_resized_logo("KC", 50)
+            self.assertEqual(cached.size, (50, 25))
+            cached.close()
+
+            manager.clear_cache("logos")
+            self.assertEqual(list(manager.resized_logos_dir.iterdir()), [])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
 
 class test_matplotlib_integration(TestCase):
     """Test matplotlib integration for NFL logos."""
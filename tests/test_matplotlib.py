@@ -12,7 +12,9 @@ from nflplotpy.matplotlib.artists import (
     add_nfl_logos,
     add_median_lines,
     add_mean_lines,
+    _load_logo_array,
 )
+from nflplotpy.core.colors import _team_colors
 from nflplotpy.matplotlib.scales import (
     nfl_color_scale,
     apply_nfl_theme,
@@ -25,6 +27,10 @@ from nflplotpy.matplotlib.scales import (
 class TestMatplotlibArtists:
     """Test matplotlib artists and logo functionality."""
 
+    def setup_method(self):
+        """Start each test without decoded logos from earlier (mocked) calls."""
+        _load_logo_array.cache_clear()
+
     def test_add_median_lines(self):
         """Test adding median reference lines."""
         fig, ax = plt.subplots()
@@ -38,6 +44,43 @@ class TestMatplotlibArtists:
 
         plt.close(fig)
 
+    def test_add_median_lines_precomputed_value(self):
+        """Test that a precomputed median is used as-is."""
+        fig, ax = plt.subplots()
+
+        add_median_lines(ax, value=2.5, axis="x")
+
+        (line,) = ax.get_lines()
+        assert line.get_xdata()[0] == 2.5
+
+        with pytest.raises(ValueError):
+            add_median_lines(ax, axis="x")
+
+        plt.close(fig)
+
+    def test_add_median_lines_multiple_axes(self):
+        """Test that one median is drawn on every axes passed in."""
+        fig, axes = plt.subplots(1, 2)
+
+        add_median_lines(axes, [1, 2, 3, 10], axis="y")
+
+        for ax in axes:
+            (line,) = ax.get_lines()
+            assert line.get_ydata()[0] == 2.5
+
+        plt.close(fig)
+
+    def test_add_median_lines_axes_grid(self):
+        """Test that a 2-D axes grid from plt.subplots gets lines on every axes."""
+        fig, axs = plt.subplots(2, 2)
+
+        add_median_lines(axs, value=1.0)
+
+        for ax in axs.flat:
+            assert len(ax.get_lines()) == 2
+
+        plt.close(fig)
+
     def test_add_mean_lines(self):
         """Test adding mean reference lines."""
         fig, ax = plt.subplots()
@@ -88,6 +131,22 @@ class TestMatplotlibArtists:
 
         plt.close(fig)
 
+    @patch("nflplotpy.matplotlib.artists.get_team_logo")
+    def test_add_nfl_logo_decodes_once(self, mock_get_logo):
+        """Test that repeated logos reuse the in-memory decoded array."""
+        mock_image = MagicMock()
+        mock_image.__array__ = MagicMock(return_value=np.ones((100, 100, 4)))
+        mock_get_logo.return_value = mock_image
+
+        fig, (ax1, ax2) = plt.subplots(1, 2)
+
+        add_nfl_logo(ax1, "ARI", 0.5, 0.5)
+        add_nfl_logo(ax2, "ari", 0.5, 0.5)
+
+        mock_get_logo.assert_called_once_with("ARI")
+
+        plt.close(fig)
+
     def test_add_nfl_logos_invalid_input(self):
         """Test error handling for invalid inputs."""
         fig, ax = plt.subplots()
@@ -123,6 +182,19 @@ class TestMatplotlibScales:
 
         plt.close(fig)
 
+    def test_dark_theme_brightens_team_spines(self):
+        """Dark theme spines use the team color brightened by 30%."""
+        fig, ax = plt.subplots()
+
+        apply_nfl_theme(ax, team="KC", style="dark")
+
+        rgb = mcolors.hex2color("#e31837")
+        expected = mcolors.rgb2hex(tuple(min(1.0, c * 1.3) for c in rgb))
+        for spine in ax.spines.values():
+            assert mcolors.to_hex(spine.get_edgecolor()) == expected
+
+        plt.close(fig)
+
     def test_set_team_colors(self):
         """Test setting team colors."""
         fig, ax = plt.subplots()
@@ -138,6 +210,57 @@ class TestMatplotlibScales:
 
         plt.close(fig)
 
+    def test_set_team_colors_single_team(self):
+        """A single team still maps to its full color string."""
+        fig, ax = plt.subplots()
+
+        assert set_team_colors(ax, ["KC"]) == {"KC": "#e31837"}
+        assert create_team_scatter_colors(["KC"]) == ["#e31837"]
+
+        plt.close(fig)
+
+    def test_team_colors_memoized_per_team_list(self):
+        """Repeated lookups for the same teams reuse one cached tuple."""
+        fig, ax = plt.subplots()
+        teams = ["ARI", "ATL", "BAL"]
+
+        first = set_team_colors(ax, teams)
+        hits = _team_colors.cache_info().hits
+        second = set_team_colors(ax, teams)
+
+        assert first == second
+        assert _team_colors.cache_info().hits == hits + 1
+
+        plt.close(fig)
+
+    def test_scale_color_nfl_alpha(self):
+        """Alpha is applied to every team's RGBA color."""
+        from nflplotpy.matplotlib.scales import scale_color_nfl
+
+        color_map = scale_color_nfl(data=["KC", "BUF"], guide=False, alpha=0.5)
+
+        assert color_map == {
+            team: (*mcolors.hex2color(color), 0.5)
+            for team, color in zip(["KC", "BUF"], ["#e31837", "#00338d"])
+        }
+
+    def test_scatter_colormap_reused_for_same_teams(self):
+        """Team-colored gradients reuse one memoized colormap in team order."""
+        from nflplotpy.core.colors import _team_colormap
+
+        teams = ["KC", "BUF", "KC", "SF"]
+        create_team_scatter_colors(teams, [1.0, 2.0, 3.0, 4.0])
+        hits = _team_colormap.cache_info().hits
+        colors = create_team_scatter_colors(teams, [1.0, 2.0, 3.0, 4.0])
+
+        assert _team_colormap.cache_info().hits == hits + 1
+        assert nfl_color_scale(["KC", "BUF", "SF"]).colors == [
+            "#e31837",
+            "#00338d",
+            "#aa0000",
+        ]
+        assert mcolors.to_hex(colors[0]) == "#e31837"
+
     def test_create_team_scatter_colors(self):
         """Test creating scatter plot colors."""
         teams = ["ARI", "ATL", "BAL"]
@@ -153,6 +276,12 @@ class TestMatplotlibScales:
         colors = create_team_scatter_colors(teams, values)
         assert len(colors) == len(teams)
 
+        # Values map through the colormap in one vectorized call
+        colors = create_team_scatter_colors(teams, values, colormap="viridis")
+        cmap = plt.get_cmap("viridis")
+        assert colors.shape == (3, 4)
+        np.testing.assert_allclose(colors, [cmap(0.0), cmap(0.5), cmap(1.0)])
+
     def test_add_team_color_legend(self):
         """Test adding team color legend."""
         fig, ax = plt.subplots()
@@ -170,6 +299,10 @@ class TestMatplotlibScales:
 class TestIntegration:
     """Integration tests for matplotlib functionality."""
 
+    def setup_method(self):
+        """Start each test without decoded logos from earlier (mocked) calls."""
+        _load_logo_array.cache_clear()
+
     def test_complete_plot_creation(self):
         """Test creating a complete plot with NFL styling."""
         # Sample data
@@ -5,6 +5,7 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import tempfile
+import warnings
 import os
 from pathlib import Path
 
@@ -62,6 +63,43 @@ class TestPandasStyling:
         html = styled.to_html()
         assert "KC" in html or "img" in html  # Either text or image
 
+    def test_logo_encoded_once_per_height(self, monkeypatch):
+        """Test that repeated logo cells reuse one encoded data URI."""
+        from PIL import Image
+
+        from nflplotpy.pandas import styling
+
+        calls = []
+
+        def fake_logo(team):
+            calls.append(team)
+            return Image.new("RGBA", (40, 20))
+
+        monkeypatch.setattr(styling, "get_team_logo", fake_logo)
+        styling._logo_data_uri.cache_clear()
+        try:
+            df = pd.DataFrame({"team": ["KC", "KC", "BUF"], "opp": ["BUF", "KC", "KC"]})
+            html = style_with_logos(df, ["team", "opp"], logo_height=10).to_html()
+        finally:
+            styling._logo_data_uri.cache_clear()
+
+        assert sorted(calls) == ["BUF", "KC"]
+        assert 'height="10px"' in html
+
+    def test_style_with_logos_linked(self, monkeypatch):
+        """Test that linked logos reference the URL without fetching it."""
+        from nflplotpy.core.logos import get_team_logo_url
+        from nflplotpy.pandas import styling
+
+        def fail_fetch(team):
+            raise AssertionError("logo should not be downloaded")
+
+        monkeypatch.setattr(styling, "get_team_logo", fail_fetch)
+        html = style_with_logos(self.sample_df, "team", embed_logos=False).to_html()
+
+        assert f'src="{get_team_logo_url("KC")}"' in html
+        assert "base64" not in html
+
     def test_nfl_table_styler_class(self):
         """Test NFLTableStyler class."""
         styler = NFLTableStyler(self.sample_df)
@@ -75,6 +113,19 @@ class TestPandasStyling:
         assert isinstance(html, str)
         assert len(html) > 100  # Should be substantial HTML
 
+    def test_with_team_colors_styles_target_columns(self):
+        """Test that team colors land only on the requested columns."""
+        from nflplotpy.core.colors import get_team_colors
+
+        df = pd.DataFrame({"team": ["KC", "XX"], "wins": [14, 2], "losses": [3, 15]})
+        styler = NFLTableStyler(df).with_team_colors("wins", "team", apply_to="text")
+
+        styler.styler._compute()
+        ctx = styler.styler.ctx
+        assert ctx[(0, 1)] == [("color", get_team_colors("KC"))]
+        assert (1, 1) not in ctx
+        assert (0, 2) not in ctx
+
     def test_create_nfl_table(self):
         """Test comprehensive table creation."""
         table = create_nfl_table(
@@ -97,6 +148,17 @@ class TestPandasStyling:
         except (OSError, PermissionError):
             pass  # File cleanup failed, but this is not critical for tests
 
+    def test_save_html_writes_in_chunks(self, monkeypatch, tmp_path):
+        """Chunked saving should reproduce the rendered HTML byte for byte."""
+        from nflplotpy.pandas import styling
+
+        monkeypatch.setattr(styling, "_WRITE_CHUNK", 7)
+        table = NFLTableStyler(pd.DataFrame({"note": ["Ångström ✅", "naïve"]}))
+        out = tmp_path / "table.html"
+        table.save_html(str(out))
+
+        assert out.read_bytes() == table.to_html().encode("utf-8")
+
     def test_style_with_headshots_real(self):
         """Test headshot styling with real URLs."""
         player_df = pd.DataFrame(
@@ -226,6 +288,65 @@ class TestMatplotlibElements:
         # Check that artists were added
         assert len(self.ax.get_children()) > 0
 
+    def test_headshot_downloaded_once(self, fake_http_session):
+        """Repeated headshots of one player should share a single download."""
+        from PIL import Image
+
+        from nflplotpy.matplotlib import elements
+
+        calls = fake_http_session(Image.new("RGB", (20, 20), "red"))
+        elements._load_headshot_image.cache_clear()
+        try:
+            for x in (0.2, 0.5, 0.8):
+                ab = elements.add_player_headshot(
+                    self.ax, "3139477", x, 0.5, id_type="espn", circular=x > 0.5
+                )
+                assert ab is not None
+        finally:
+            elements._load_headshot_image.cache_clear()
+
+        assert len(calls) == 1
+
+    def test_wordmark_downloaded_once(self, fake_http_session):
+        """Repeated wordmarks for a team should reuse one decoded image."""
+        from PIL import Image
+
+        from nflplotpy.matplotlib import elements
+
+        calls = fake_http_session(Image.new("P", (30, 10)))
+        elements._load_wordmark_array.cache_clear()
+        try:
+            for x in (0.2, 0.5, 0.8):
+                ab = elements.add_team_wordmark(self.ax, "KC", x, 0.5)
+                assert ab is not None
+            elements.add_team_wordmark(self.ax, "BUF", 0.5, 0.2)
+        finally:
+            elements._load_wordmark_array.cache_clear()
+
+        assert len(calls) == 2
+        image = ab.offsetbox.get_data()
+        assert image.shape == (10, 30, 4)
+        assert not image.flags.writeable
+
+    def test_prefetch_player_headshots(self, fake_http_session):
+        """Prefetching should load each distinct headshot into the cache."""
+        from PIL import Image
+
+        from nflplotpy.matplotlib import elements
+
+        calls = fake_http_session(Image.new("RGB", (20, 20), "blue"))
+        elements._load_headshot_image.cache_clear()
+        try:
+            loaded = elements.prefetch_player_headshots(
+                ["3139477", "3918298", "3139477"], id_type="espn"
+            )
+            elements.add_player_headshot(self.ax, "3918298", 0.5, 0.5, id_type="espn")
+        finally:
+            elements._load_headshot_image.cache_clear()
+
+        assert loaded == 2
+        assert len(calls) == 2
+
     def test_set_xlabel_with_logos(self):
         """Test x-axis logo labels."""
         teams = ["KC", "BUF"]
@@ -237,6 +358,32 @@ class TestMatplotlibElements:
         # Check that ticks were set
         assert len(self.ax.get_xticks()) >= len(teams)
 
+    def test_label_margins_apply_to_axes_figure(self):
+        """Logo labels adjust their own figure, even one outside pyplot."""
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        ax = fig.subplots()
+        open_figures = plt.get_fignums()
+
+        set_xlabel_with_logos(ax, ["KC"], [0])
+
+        assert fig.subplotpars.bottom == pytest.approx(0.2)
+        assert plt.get_fignums() == open_figures
+
+    def test_label_margins_respect_constrained_layout(self):
+        """Logo labels leave spacing to a figure's layout engine."""
+        from matplotlib.figure import Figure
+
+        fig = Figure(layout="constrained")
+        ax = fig.subplots()
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", message=".*subplots_adjust.*")
+            set_xlabel_with_logos(ax, ["KC"], [0])
+
+        assert fig.get_layout_engine() is not None
+
 
 class TestURLManagement:
     """Test URL management system."""
@@ -279,6 +426,52 @@ class TestURLManagement:
         if player_ids["espn_id"]:
             assert isinstance(player_ids["espn_id"], str)
 
+    def test_batch_player_info_matches_single_lookups(self):
+        """Batch lookups should agree with one-at-a-time lookups."""
+        from nflplotpy.core.nfl_data_integration import NFLDataPlayerManager
+
+        manager = NFLDataPlayerManager()
+        manager._id_data = pd.DataFrame(
+            {
+                "gsis_id": ["00-1", "00-2", "00-2"],
+                "espn_id": [111.0, np.nan, 333.0],
+                "name": ["One", "Two", "Two Dup"],
+            }
+        )
+
+        infos = manager.get_players_info_by_ids(["00-2", "00-1", "00-9"])
+
+        assert list(infos) == ["00-2", "00-1", "00-9"]
+        assert infos["00-1"]["espn_id"] == "111"
+        assert infos["00-2"]["name"] == "Two"
+        assert infos["00-9"]["espn_id"] is None
+        single = NFLDataPlayerManager()
+        single._id_data = manager._id_data
+        for player_id, info in infos.items():
+            assert single.get_player_info_by_id(player_id) == info
+
+    def test_batch_player_info_bad_ids_warn(self):
+        """Bad IDs in a batch should warn and return empty records."""
+        from nflplotpy.core.nfl_data_integration import NFLDataPlayerManager
+
+        manager = NFLDataPlayerManager()
+        manager._id_data = pd.DataFrame(
+            {"gsis_id": ["00-1"], "espn_id": [111.0], "name": ["One"]}
+        )
+
+        with pytest.warns(UserWarning, match="espn ID not-a-number"):
+            infos = manager.get_players_info_by_ids(["111", "not-a-number"], "espn")
+
+        assert infos["111"]["name"] == "One"
+        assert infos["not-a-number"]["gsis_id"] is None
+        assert infos["not-a-number"] == manager.get_player_info_by_id(
+            "not-a-number", "espn"
+        )
+
+        with pytest.warns(UserWarning, match="Unsupported ID type"):
+            infos = manager.get_players_info_by_ids(["00-1"], "pfr")
+        assert infos["00-1"]["name"] is None
+
     def test_url_validation(self):
         """Test URL validation."""
         manager = AssetURLManager()